@@ -3,14 +3,12 @@
 Clean fix for UR10 position display using correct packet offsets
 """
 
-import re
-
-with open('src/communication/websocket_receiver.py', 'r') as f:
+with open('src/communication/websocket_receiver.py', 'rb') as f:
     content = f.read()
 
 # 1. Fix the data processing to call parsing directly
 content = content.replace(
-    '''            # Parse message type (first byte)
+    b'''            # Parse message type (first byte)
             if len(data) < 1:
                 return
             
@@ -24,7 +22,7 @@ content = content.replace(
                 self._parse_robot_state_message(data, offset)
             elif message_type == 20:  # Safety message (example)
                 self._parse_safety_message(data, offset)''',
-    '''            # UR real-time interface sends continuous robot state data
+    b'''            # UR real-time interface sends continuous robot state data
             self._parse_robot_state_message(data, 0)'''
 )
 
@@ -69,29 +67,32 @@ new_parse_method = '''    def _parse_robot_state_message(self, data: bytes, offs
             offset: Current parsing offset
         """
         try:
-            if len(data) < 500:
+            if len(data) < 488:  # Both vectors end by byte 488
                 return
                 
             # Based on packet analysis of actual UR10 data:
             # Joint angles at offset 8 (big-endian, 6 doubles)
             joint_offset = 8
-            if len(data) >= joint_offset + 48:
-                joint_angles = list(struct.unpack('>6d', data[joint_offset:joint_offset + 48]))
-                self.robot_state['joint_angles'] = joint_angles
+            joint_angles = _SIX_DOUBLES_BE.unpack_from(data, joint_offset)
+            self.robot_state['joint_angles'] = joint_angles
             
             # TCP pose at offset 440 (big-endian, 6 doubles: x,y,z,rx,ry,rz)
             tcp_offset = 440
-            if len(data) >= tcp_offset + 48:
-                tcp_pose = list(struct.unpack('>6d', data[tcp_offset:tcp_offset + 48]))
-                self.robot_state['tcp_pose'] = tcp_pose'''
+            tcp_pose = _SIX_DOUBLES_BE.unpack_from(data, tcp_offset)
+            self.robot_state['tcp_pose'] = tcp_pose'''
 
 # Only replace the start of the method to avoid breaking the rest
-method_start_pattern = r'(def _parse_robot_state_message\(self, data: bytes, offset: int\):.*?joint_angles = joint_angles)'
-replacement = new_parse_method
+method_start = b'    def _parse_robot_state_message(self, data: bytes, offset: int):'
+method_start_end = b'joint_angles = joint_angles'
 
-content = re.sub(method_start_pattern, replacement, content, flags=re.DOTALL)
+start = content.find(method_start)
+if start != -1:
+    end = content.find(method_start_end, start)
+    if end != -1:
+        end += len(method_start_end)
+        content = content[:start] + new_parse_method.encode('utf-8') + content[end:]
 
-with open('src/communication/websocket_receiver.py', 'w') as f:
+with open('src/communication/websocket_receiver.py', 'wb') as f:
     f.write(content)
 
 print("✅ Applied clean UR10 position fix!")
@@ -7,7 +7,6 @@ Author: jsecco ®
 
 import sys
 import os
-import time
 import traceback
 from pathlib import Path
 
@@ -15,6 +14,18 @@ from pathlib import Path
 src_dir = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_dir))
 
+# One QApplication shared by all tests - recreating it repeats the platform
+# plugin probe and font setup, and double-initializing Qt can crash on Wayland
+_app = None
+
+def get_application():
+    """Return the shared QApplication, creating it on first use."""
+    global _app
+    if _app is None:
+        from PyQt6.QtWidgets import QApplication
+        _app = QApplication.instance() or QApplication(sys.argv)
+    return _app
+
 def test_basic_qt():
     """Test basic Qt functionality."""
     print("🔍 Testing basic Qt functionality...")
@@ -26,7 +37,7 @@ def test_basic_qt():
         print("✅ Qt imports successful")
         
         # Test QApplication creation
-        app = QApplication.instance() or QApplication(sys.argv)
+        app = get_application()
         print("✅ QApplication created")
         
         # Test basic widget creation
@@ -106,10 +117,10 @@ def run_minimal_app():
     print("🔍 Testing minimal Qt application...")
     
     try:
-        from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel
-        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QMainWindow, QLabel
+        from PyQt6.QtTest import QTest
         
-        app = QApplication.instance() or QApplication(sys.argv)
+        app = get_application()
         
         # Create minimal window
         window = QMainWindow()
@@ -120,18 +131,12 @@ def run_minimal_app():
         
         print("✅ Minimal window created and shown")
         
-        # Set up a timer to close after 3 seconds
-        def close_app():
-            print("✅ Timer triggered - closing test app")
-            app.quit()
-            
-        timer = QTimer()
-        timer.timeout.connect(close_app)
-        timer.start(3000)  # 3 seconds
-        
-        print("🚀 Starting Qt event loop for 3 seconds...")
-        result = app.exec()
-        print(f"✅ Qt event loop finished with code: {result}")
+        # Spin a local event loop for 3 seconds without taking over app.exec()
+        print("🚀 Processing Qt events for 3 seconds...")
+        QTest.qWait(3000)
+        app.processEvents()
+        window.close()
+        print("✅ Qt event processing finished")
         
         return True
         
@@ -167,8 +172,6 @@ def main():
             print(f"❌ {test_name} crashed: {e}")
             traceback.print_exc()
             results[test_name] = False
-        
-        time.sleep(1)  # Small delay between tests
     
     # Summary
     print(f"\n{'='*50}")
@@ -34,25 +34,28 @@ def diagnose_packet(data):
     print(f"\n📦 Packet #{packet_count} - Size: {len(data)} bytes")
     
     # Show first 64 bytes as hex
-    hex_data = ' '.join(f'{b:02x}' for b in data[:64])
+    hex_data = data[:64].hex(' ')
     print(f"First 64 bytes (hex): {hex_data}")
     
     # Try to find reasonable double values at different offsets
     print("\n🔍 Testing for reasonable doubles at different offsets:")
     
-    for offset in range(0, min(len(data)-48, 500), 8):  # Test every 8 bytes
-        try:
-            # Try both endiannesses
-            for endian, name in [('<', 'LE'), ('>', 'BE')]:
-                if len(data) >= offset + 48:
-                    values = struct.unpack(f'{endian}6d', data[offset:offset + 48])
-                    
-                    # Check if these look like reasonable robot values
-                    if all(-10 < v < 10 for v in values):  # Reasonable range for joints or TCP
-                        print(f"  Offset {offset:3d} ({name}): {[f'{v:.3f}' for v in values]}")
-                        
-        except struct.error:
-            continue
+    offsets = range(0, min(len(data)-48, 500), 8)  # Test every 8 bytes
+    if offsets:
+        # Decode the whole scanned region once per endianness and range-check
+        # each double once; every offset is then a 6-wide window over it
+        n_doubles = len(offsets) + 5
+        decoded = []
+        for endian, name in [('<', 'LE'), ('>', 'BE')]:
+            doubles = struct.unpack_from(f'{endian}{n_doubles}d', data)
+            reasonable = [-10 < v < 10 for v in doubles]  # Reasonable range for joints or TCP
+            decoded.append((name, doubles, reasonable))
+        
+        for i, offset in enumerate(offsets):
+            for name, doubles, reasonable in decoded:
+                if all(reasonable[i:i + 6]):
+                    values = doubles[i:i + 6]
+                    print(f"  Offset {offset:3d} ({name}): {[f'{v:.3f}' for v in values]}")
             
     print(f"{'='*80}")
 
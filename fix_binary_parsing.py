@@ -4,7 +4,7 @@ Fix the binary data parsing in WebSocket receiver for correct UR10 position extr
 """
 
 # Read the websocket receiver file
-with open('src/communication/websocket_receiver.py', 'r') as f:
+with open('src/communication/websocket_receiver.py', 'rb') as f:
     content = f.read()
 
 # Replace the parsing section with correct UR10 offsets
@@ -32,7 +32,10 @@ new_parsing = """            # Parse UR10 real-time data packet structure
             # Message size: 1108 bytes (header + robot state data)
             
             if len(data) < 1108:
-                self.logger.debug(f"Incomplete UR packet: {len(data)} bytes")
+                # Count short packets and only report the first and every 1000th after it
+                self._short_packets = getattr(self, '_short_packets', 0) + 1
+                if self._short_packets % 1000 == 1:
+                    self.logger.debug("Incomplete UR packet: %d bytes (%d short so far)", len(data), self._short_packets)
                 return
                 
             # Skip message header and parse robot state
@@ -57,25 +60,25 @@ new_parsing = """            # Parse UR10 real-time data packet structure
             
             # Actual joint positions offset: base + (5 * 48) = 252
             joint_positions_offset = base_offset + (5 * 48)  # Skip 5 sections of 6 doubles each
-            if len(data) >= joint_positions_offset + 48:
-                joint_angles = list(struct.unpack('>6d', data[joint_positions_offset:joint_positions_offset + 48]))
-                self.robot_state['joint_angles'] = joint_angles
-                # DEBUG: Log joint angles
-                self.logger.info(f"Joint Angles: J1={joint_angles[0]*57.3:.1f}°, J2={joint_angles[1]*57.3:.1f}°, J3={joint_angles[2]*57.3:.1f}°")
+            joint_angles = _SIX_DOUBLES_BE.unpack_from(data, joint_positions_offset)
+            self.robot_state['joint_angles'] = joint_angles
+            # DEBUG: Log joint angles
+            if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Joint Angles: J1=%.1f°, J2=%.1f°, J3=%.1f°", joint_angles[0]*57.3, joint_angles[1]*57.3, joint_angles[2]*57.3)
             
             # Actual TCP pose offset: base + (9 * 48) = 444  
             tcp_pose_offset = base_offset + (9 * 48)  # Skip 9 sections of 6 doubles each
-            if len(data) >= tcp_pose_offset + 48:
-                tcp_pose = list(struct.unpack('>6d', data[tcp_pose_offset:tcp_pose_offset + 48]))
-                self.robot_state['tcp_pose'] = tcp_pose
-                # DEBUG: Log TCP position
-                self.logger.info(f"TCP Position: X={tcp_pose[0]*1000:.1f}mm, Y={tcp_pose[1]*1000:.1f}mm, Z={tcp_pose[2]*1000:.1f}mm")"""
+            tcp_pose = _SIX_DOUBLES_BE.unpack_from(data, tcp_pose_offset)
+            self.robot_state['tcp_pose'] = tcp_pose
+            # DEBUG: Log TCP position
+            if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("TCP Position: X=%.1fmm, Y=%.1fmm, Z=%.1fmm", tcp_pose[0]*1000, tcp_pose[1]*1000, tcp_pose[2]*1000)"""
 
 # Replace the old parsing with the new one
-content = content.replace(old_parsing, new_parsing)
+content = content.replace(old_parsing.encode('utf-8'), new_parsing.encode('utf-8'))
 
 # Write the fixed file
-with open('src/communication/websocket_receiver.py', 'w') as f:
+with open('src/communication/websocket_receiver.py', 'wb') as f:
     f.write(content)
 
 print("✅ Fixed binary data parsing with correct UR10 packet structure")
@@ -2,19 +2,14 @@
 
 # Read the file
 with open('src/ui/main_window.py', 'r') as f:
-    lines = f.readlines()
+    content = f.read()
 
-# Find the _create_center_panel method
-start_line = None
-end_line = None
-for i, line in enumerate(lines):
-    if '_create_center_panel(self, layout: QHBoxLayout):' in line:
-        start_line = i
-    elif start_line is not None and line.strip().startswith('def ') and 'create_center_panel' not in line:
-        end_line = i
-        break
+# Find the _create_center_panel method: it runs up to the next method definition
+method_start = '    def _create_center_panel(self, layout: QHBoxLayout):'
+start = content.find(method_start)
+end = content.find('\n    def ', start + len(method_start)) + 1 if start != -1 else 0
 
-if start_line and end_line:
+if start > 0 and end > 0:
     # Replace the method with our simplified version
     new_method = [
         '    def _create_center_panel(self, layout: QHBoxLayout):\n',
@@ -38,12 +33,14 @@ if start_line and end_line:
         '        \n',
     ]
     
-    # Replace the lines
-    new_lines = lines[:start_line] + new_method + lines[end_line:]
+    # Splice the method in
+    start_line = content.count('\n', 0, start)
+    end_line = content.count('\n', 0, end)
+    content = content[:start] + ''.join(new_method) + content[end:]
     
     # Write back
     with open('src/ui/main_window.py', 'w') as f:
-        f.writelines(new_lines)
+        f.write(content)
     
     print(f"✅ Replaced _create_center_panel method (lines {start_line+1}-{end_line})")
 else:
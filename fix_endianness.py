@@ -3,76 +3,71 @@
 Fix endianness and try different UR packet parsing approaches
 """
 
-with open('src/communication/websocket_receiver.py', 'r') as f:
+with open('src/communication/websocket_receiver.py', 'rb') as f:
     content = f.read()
 
 # Replace the parsing with corrected endianness and debugging
 old_parsing = '''            # Actual joint positions offset: base + (5 * 48) = 252
             joint_positions_offset = base_offset + (5 * 48)  # Skip 5 sections of 6 doubles each
-            if len(data) >= joint_positions_offset + 48:
-                joint_angles = list(struct.unpack('>6d', data[joint_positions_offset:joint_positions_offset + 48]))
-                self.robot_state['joint_angles'] = joint_angles
-                # DEBUG: Log joint angles
-                self.logger.info(f"Joint Angles: J1={joint_angles[0]*57.3:.1f}°, J2={joint_angles[1]*57.3:.1f}°, J3={joint_angles[2]*57.3:.1f}°")
+            joint_angles = _SIX_DOUBLES_BE.unpack_from(data, joint_positions_offset)
+            self.robot_state['joint_angles'] = joint_angles
+            # DEBUG: Log joint angles
+            if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Joint Angles: J1=%.1f°, J2=%.1f°, J3=%.1f°", joint_angles[0]*57.3, joint_angles[1]*57.3, joint_angles[2]*57.3)
             
             # Actual TCP pose offset: base + (9 * 48) = 444  
             tcp_pose_offset = base_offset + (9 * 48)  # Skip 9 sections of 6 doubles each
-            if len(data) >= tcp_pose_offset + 48:
-                tcp_pose = list(struct.unpack('>6d', data[tcp_pose_offset:tcp_pose_offset + 48]))
-                self.robot_state['tcp_pose'] = tcp_pose
-                # DEBUG: Log TCP position
-                self.logger.info(f"TCP Position: X={tcp_pose[0]*1000:.1f}mm, Y={tcp_pose[1]*1000:.1f}mm, Z={tcp_pose[2]*1000:.1f}mm")'''
+            tcp_pose = _SIX_DOUBLES_BE.unpack_from(data, tcp_pose_offset)
+            self.robot_state['tcp_pose'] = tcp_pose
+            # DEBUG: Log TCP position
+            if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("TCP Position: X=%.1fmm, Y=%.1fmm, Z=%.1fmm", tcp_pose[0]*1000, tcp_pose[1]*1000, tcp_pose[2]*1000)'''
 
 new_parsing = '''            # Try different parsing approaches for UR real-time data
-            # Let's try multiple offset positions and endiannesses
+            # Little-endian at the standard UR offsets is tried first, then big-endian
+            # at other candidate offsets. The first layout that gives plausible values
+            # is cached, so later packets decode it directly without probing.
+            # (every probed vector ends well inside the 1108-byte packet checked above)
+            if getattr(self, '_joint_layout', None) is None:
+                for layout in [(_SIX_DOUBLES_LE, 252)] + [(_SIX_DOUBLES_BE, o) for o in (12, 60, 108, 156, 204, 252, 300, 348, 396, 444)]:
+                    # Joint angles should be roughly -pi to +pi (10 radians = ~570 degrees max)
+                    if all(abs(angle) < 10 for angle in layout[0].unpack_from(data, layout[1])):
+                        self._joint_layout = layout
+                        self.logger.info("Joint angles found at offset %d (%s)", layout[1], layout[0].format)
+                        break
             
-            # Method 1: Try little-endian at standard UR offsets
-            try:
-                # Joint angles at offset 252 (little-endian)
-                joint_positions_offset = 252
-                if len(data) >= joint_positions_offset + 48:
-                    joint_angles = list(struct.unpack('<6d', data[joint_positions_offset:joint_positions_offset + 48]))
-                    # Check if values are reasonable (joint angles should be roughly -pi to +pi)
-                    if all(abs(angle) < 10 for angle in joint_angles):  # 10 radians = ~570 degrees (reasonable max)
-                        self.robot_state['joint_angles'] = joint_angles
-                        self.logger.info(f"Joint Angles (LE): J1={joint_angles[0]*57.3:.1f}°, J2={joint_angles[1]*57.3:.1f}°, J3={joint_angles[2]*57.3:.1f}°")
-                
-                # TCP pose at offset 444 (little-endian)  
-                tcp_pose_offset = 444
-                if len(data) >= tcp_pose_offset + 48:
-                    tcp_pose = list(struct.unpack('<6d', data[tcp_pose_offset:tcp_pose_offset + 48]))
-                    # Check if values are reasonable (position should be roughly -5m to +5m)
-                    if all(abs(pos) < 5.0 for pos in tcp_pose[:3]):  # First 3 are positions
-                        self.robot_state['tcp_pose'] = tcp_pose
-                        self.logger.info(f"TCP Position (LE): X={tcp_pose[0]*1000:.1f}mm, Y={tcp_pose[1]*1000:.1f}mm, Z={tcp_pose[2]*1000:.1f}mm")
-            except:
-                pass
-                
-            # Method 2: If little-endian failed, try big-endian at different offsets
-            if 'joint_angles' not in self.robot_state or 'tcp_pose' not in self.robot_state:
-                try:
-                    # Try different offsets - maybe packet structure is different
-                    for test_offset in [12, 60, 108, 156, 204, 252, 300, 348, 396, 444]:
-                        if len(data) >= test_offset + 48:
-                            test_joints = list(struct.unpack('>6d', data[test_offset:test_offset + 48]))
-                            if all(abs(angle) < 10 for angle in test_joints):
-                                self.robot_state['joint_angles'] = test_joints
-                                self.logger.info(f"Joint Angles (BE@{test_offset}): J1={test_joints[0]*57.3:.1f}°")
-                                break
-                                
-                    for test_offset in [400, 444, 500, 550, 600, 650]:
-                        if len(data) >= test_offset + 48:
-                            test_tcp = list(struct.unpack('>6d', data[test_offset:test_offset + 48]))
-                            if all(abs(pos) < 5.0 for pos in test_tcp[:3]):
-                                self.robot_state['tcp_pose'] = test_tcp
-                                self.logger.info(f"TCP Position (BE@{test_offset}): X={test_tcp[0]*1000:.1f}mm")
-                                break
-                except:
-                    pass'''
+            if getattr(self, '_tcp_layout', None) is None:
+                for layout in [(_SIX_DOUBLES_LE, 444)] + [(_SIX_DOUBLES_BE, o) for o in (400, 444, 500, 550, 600, 650)]:
+                    # Position should be roughly -5m to +5m (first 3 are positions)
+                    if all(abs(pos) < 5.0 for pos in layout[0].unpack_from(data, layout[1])[:3]):
+                        self._tcp_layout = layout
+                        self.logger.info("TCP pose found at offset %d (%s)", layout[1], layout[0].format)
+                        break
+            
+            if getattr(self, '_joint_layout', None) is not None:
+                decoder, joint_positions_offset = self._joint_layout
+                joint_angles = decoder.unpack_from(data, joint_positions_offset)
+                self.robot_state['joint_angles'] = joint_angles
+                if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Joint Angles: J1=%.1f°, J2=%.1f°, J3=%.1f°", joint_angles[0]*57.3, joint_angles[1]*57.3, joint_angles[2]*57.3)
+            
+            if getattr(self, '_tcp_layout', None) is not None:
+                decoder, tcp_pose_offset = self._tcp_layout
+                tcp_pose = decoder.unpack_from(data, tcp_pose_offset)
+                self.robot_state['tcp_pose'] = tcp_pose
+                if (self.messages_received & 0xFF) == 0 and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("TCP Position: X=%.1fmm, Y=%.1fmm, Z=%.1fmm", tcp_pose[0]*1000, tcp_pose[1]*1000, tcp_pose[2]*1000)'''
+
+content = content.replace(old_parsing.encode('utf-8'), new_parsing.encode('utf-8'))
 
-content = content.replace(old_parsing, new_parsing)
+# The little-endian attempts need their own pre-compiled decoder
+if b'_SIX_DOUBLES_LE' not in content.split(b'class WebSocketReceiver')[0]:
+    content = content.replace(
+        b"_SIX_DOUBLES_BE = struct.Struct('>6d')\n",
+        b"_SIX_DOUBLES_BE = struct.Struct('>6d')\n_SIX_DOUBLES_LE = struct.Struct('<6d')\n"
+    )
 
-with open('src/communication/websocket_receiver.py', 'w') as f:
+with open('src/communication/websocket_receiver.py', 'wb') as f:
     f.write(content)
 
 print("✅ Fixed endianness and added adaptive parsing")
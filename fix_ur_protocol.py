@@ -3,11 +3,11 @@
 Fix the UR protocol handling to properly parse continuous real-time data
 """
 
-with open('src/communication/websocket_receiver.py', 'r') as f:
+with open('src/communication/websocket_receiver.py', 'rb') as f:
     content = f.read()
 
 # Replace the message type filtering with direct parsing
-old_section = """            # Parse message type (first byte)
+old_section = b"""            # Parse message type (first byte)
             if len(data) < 1:
                 return
             
@@ -22,13 +22,13 @@ old_section = """            # Parse message type (first byte)
             elif message_type == 20:  # Safety message (example)
                 self._parse_safety_message(data, offset)"""
 
-new_section = """            # UR real-time interface sends continuous robot state data
+new_section = b"""            # UR real-time interface sends continuous robot state data
             # No message type filtering needed - all packets are robot state
             self._parse_robot_state_message(data, 0)  # Parse from beginning"""
 
 content = content.replace(old_section, new_section)
 
-with open('src/communication/websocket_receiver.py', 'w') as f:
+with open('src/communication/websocket_receiver.py', 'wb') as f:
     f.write(content)
 
 print("✅ Fixed UR protocol to parse continuous real-time data directly")
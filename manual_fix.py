@@ -19,18 +19,16 @@ for line in lines:
         new_lines.append(' ' * 8 + 'Parse robot state message from UR binary data format.\n')
         new_lines.append(' ' * 8 + '"""\n')
         new_lines.append(' ' * 8 + 'try:\n')
-        new_lines.append(' ' * 12 + 'if len(data) < 500:\n')
+        new_lines.append(' ' * 12 + 'if len(data) < 488:  # Both vectors end by byte 488\n')
         new_lines.append(' ' * 16 + 'return\n')
         new_lines.append(' ' * 12 + '\n')
         new_lines.append(' ' * 12 + '# Joint angles at offset 8 (from packet analysis)\n')
-        new_lines.append(' ' * 12 + 'if len(data) >= 56:\n')
-        new_lines.append(' ' * 16 + 'joint_angles = list(struct.unpack(\'>6d\', data[8:56]))\n')
-        new_lines.append(' ' * 16 + 'self.robot_state[\'joint_angles\'] = joint_angles\n')
+        new_lines.append(' ' * 12 + 'joint_angles = _SIX_DOUBLES_BE.unpack_from(data, 8)\n')
+        new_lines.append(' ' * 12 + 'self.robot_state[\'joint_angles\'] = joint_angles\n')
         new_lines.append(' ' * 12 + '\n')  
         new_lines.append(' ' * 12 + '# TCP pose at offset 440 (from packet analysis)\n')
-        new_lines.append(' ' * 12 + 'if len(data) >= 488:\n')
-        new_lines.append(' ' * 16 + 'tcp_pose = list(struct.unpack(\'>6d\', data[440:488]))\n')
-        new_lines.append(' ' * 16 + 'self.robot_state[\'tcp_pose\'] = tcp_pose\n')
+        new_lines.append(' ' * 12 + 'tcp_pose = _SIX_DOUBLES_BE.unpack_from(data, 440)\n')
+        new_lines.append(' ' * 12 + 'self.robot_state[\'tcp_pose\'] = tcp_pose\n')
         new_lines.append(' ' * 12 + '\n')
         new_lines.append(' ' * 8 + 'except Exception as e:\n')
         new_lines.append(' ' * 12 + 'self.logger.debug(f"Error parsing robot state: {e}")\n')
@@ -3,20 +3,16 @@
 Quick test of the working Wayland configuration.
 """
 
-import os
 import sys
 from pathlib import Path
 
-# Set up working Wayland environment
-os.environ['WAYLAND_DISPLAY'] = 'wayland-0'
-os.environ['XDG_SESSION_TYPE'] = 'wayland'
-os.environ['XDG_RUNTIME_DIR'] = '/run/user/1000'
-if 'DISPLAY' in os.environ:
-    del os.environ['DISPLAY']
-
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Set up working Wayland environment (before any PyQt6 import)
+from platform_env import configure_wayland
+configure_wayland()
+
 try:
     from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel
     from PyQt6.QtCore import QTimer
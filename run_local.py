@@ -7,16 +7,16 @@ Author: jsecco ®
 """
 
 import sys
-import os
 from pathlib import Path
 
-# Add src directory to Python path
-src_dir = Path(__file__).parent / 'src'
-sys.path.insert(0, str(src_dir))
+# Add src directory to Python path (first, so our 'main' wins), unless already there
+src_dir = str(Path(__file__).parent / 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
-# Set environment for local display
-os.environ['DISPLAY'] = ':0'
-os.environ['QT_QPA_PLATFORM'] = 'xcb'
+# Set environment for local display (before main pulls in PyQt6)
+from platform_env import configure_xcb
+configure_xcb()
 
 # Import and run main
 from main import main
@@ -10,12 +10,36 @@ Author: jsecco ®
 """
 
 import socket
+import select
 import time
 import threading
 import logging
 import struct
 from typing import List, Dict, Optional, Callable, Any
 
+# Pre-compiled decoders for the real-time packet (big-endian).
+# For six-element vectors a cached Struct is cheaper than numpy.frombuffer,
+# whose array setup costs more than the decode, and avoids a numpy dependency.
+_MESSAGE_LENGTH = struct.Struct('>I')
+_SIX_DOUBLES_BE = struct.Struct('>6d')
+
+# Byte offsets of the vectors we read (from packet analysis)
+JOINT_ANGLES_OFFSET = 8
+TCP_POSE_OFFSET = 440
+MIN_STATE_MESSAGE_SIZE = TCP_POSE_OFFSET + _SIX_DOUBLES_BE.size
+
+# Stale packets dropped in a row before one is published anyway (50 ms at 500 Hz)
+MAX_SKIPPED_PACKETS = 25
+
+# Joint angles and TCP pose in one call, padding over the bytes between them
+_STATE_VECTORS = struct.Struct(
+    f'>6d{TCP_POSE_OFFSET - JOINT_ANGLES_OFFSET - _SIX_DOUBLES_BE.size}x6d'
+)
+
+# Bound once so the hot paths call straight into the Struct methods
+_unpack_message_length = _MESSAGE_LENGTH.unpack
+_unpack_state_vectors = _STATE_VECTORS.unpack_from
+
 class WebSocketReceiver:
     """
     Real-time WebSocket receiver for UR10 robot state data.
@@ -172,7 +196,7 @@ class WebSocketReceiver:
         Returns:
             TCP pose [x, y, z, rx, ry, rz] in meters and radians
         """
-        return self.robot_state['tcp_pose'].copy()
+        return list(self.robot_state['tcp_pose'])
     
     def get_joint_angles(self) -> List[float]:
         """
@@ -181,7 +205,7 @@ class WebSocketReceiver:
         Returns:
             Joint angles [j1, j2, j3, j4, j5, j6] in radians
         """
-        return self.robot_state['joint_angles'].copy()
+        return list(self.robot_state['joint_angles'])
     
     def get_tcp_speed(self) -> List[float]:
         """
@@ -190,7 +214,7 @@ class WebSocketReceiver:
         Returns:
             TCP velocity [vx, vy, vz, vrx, vry, vrz] in m/s and rad/s
         """
-        return self.robot_state['tcp_speed'].copy()
+        return list(self.robot_state['tcp_speed'])
     
     def get_joint_speeds(self) -> List[float]:
         """
@@ -199,7 +223,7 @@ class WebSocketReceiver:
         Returns:
             Joint velocities [j1, j2, j3, j4, j5, j6] in rad/s
         """
-        return self.robot_state['joint_speeds'].copy()
+        return list(self.robot_state['joint_speeds'])
     
     def is_emergency_stopped(self) -> bool:
         """Check if robot is in emergency stop state."""
@@ -252,7 +276,14 @@ class WebSocketReceiver:
         Continuous loop for receiving real-time robot data.
         Runs in separate thread to process incoming data at high frequency.
         """
+        skipped_packets = 0
         while not self.should_stop.is_set() and self.connected:
+            # disconnect() may close the socket or set it to None from another
+            # thread, so this iteration works on the one it started with
+            sock = self.socket
+            if sock is None:
+                self.connected = False
+                break
             try:
                 # Read message header (message length)
                 header_data = self._recv_exact(4)
@@ -260,7 +291,7 @@ class WebSocketReceiver:
                     continue
                 
                 # Unpack message length (big-endian integer)
-                message_length = struct.unpack('>I', header_data)[0]
+                message_length = _unpack_message_length(header_data)[0]
                 
                 if message_length > 10000:  # Sanity check
                     self.logger.warning(f"Unusually large message length: {message_length}")
@@ -271,8 +302,23 @@ class WebSocketReceiver:
                 if not message_data:
                     continue
                 
-                # Process the message
-                self._process_realtime_data(message_data)
+                # Consumers only need the latest state: if the next packet is
+                # already waiting we are behind the robot, so drop this one.
+                # At most MAX_SKIPPED_PACKETS in a row are dropped, so a steady
+                # backlog still publishes a state every 50 ms
+                try:
+                    behind = (skipped_packets < MAX_SKIPPED_PACKETS
+                              and bool(select.select([sock], [], [], 0)[0]))
+                except (OSError, ValueError) as e:
+                    # A socket closed under us fails like a lost recv
+                    self.logger.error("Error polling real-time socket: %s", e)
+                    self.connected = False
+                    break
+                if behind:
+                    skipped_packets += 1
+                else:
+                    skipped_packets = 0
+                    self._process_realtime_data(message_data)
                 
                 # Update statistics
                 self.messages_received += 1
@@ -295,7 +341,7 @@ class WebSocketReceiver:
                 self.connected = False
                 break
     
-    def _recv_exact(self, length: int) -> Optional[bytes]:
+    def _recv_exact(self, length: int) -> Optional[bytearray]:
         """
         Receive exactly the specified number of bytes.
         
@@ -305,15 +351,18 @@ class WebSocketReceiver:
         Returns:
             Received data or None if connection lost
         """
-        data = b''
-        while len(data) < length:
+        # Receive straight into one buffer; memoryview slices are copy-free
+        data = bytearray(length)
+        view = memoryview(data)
+        received = 0
+        while received < length:
             try:
-                chunk = self.socket.recv(length - len(data))
-                if not chunk:
+                count = self.socket.recv_into(view[received:])
+                if not count:
                     self.logger.warning("Connection lost during data reception")
                     self.connected = False
                     return None
-                data += chunk
+                received += count
             except socket.timeout:
                 continue
             except Exception as e:
@@ -334,8 +383,6 @@ class WebSocketReceiver:
             # The actual format is quite complex and depends on the UR version
             # For a complete implementation, refer to the UR documentation
             
-            offset = 0
-            
             # Update timestamp
             self.robot_state['timestamp'] = time.time()
             
@@ -353,21 +400,18 @@ class WebSocketReceiver:
         Parse robot state message from UR binary data format.
         """
         try:
-            if len(data) < 500:
+            # One bounds check covers both vectors (joints end at 56, TCP at 488)
+            if len(data) < MIN_STATE_MESSAGE_SIZE:
                 return
             
-            # Joint angles at offset 8 (from packet analysis)
-            if len(data) >= 56:
-                joint_angles = list(struct.unpack('>6d', data[8:56]))
-                self.robot_state['joint_angles'] = joint_angles
-            
-            # TCP pose at offset 440 (from packet analysis)
-            if len(data) >= 488:
-                tcp_pose = list(struct.unpack('>6d', data[440:488]))
-                self.robot_state['tcp_pose'] = tcp_pose
+            # Decode in place - unpack_from avoids slicing a copy of the packet
+            values = _unpack_state_vectors(data, JOINT_ANGLES_OFFSET)
+            self.robot_state['joint_angles'] = values[:6]
+            self.robot_state['tcp_pose'] = values[6:]
             
         except Exception as e:
             self.logger.debug(f"Error parsing robot state: {e}")
+
     def _parse_safety_message(self, data: bytes, offset: int):
         """
         Parse safety status message from binary data.
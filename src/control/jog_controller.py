@@ -55,6 +55,10 @@ class JogController:
     Coordinates between Cartesian and Joint jogging modes with safety monitoring.
     """
     
+    # Status fields the safety display strings are rendered from
+    SAFETY_DISPLAY_INPUTS = ('robot_mode', 'safety_mode', 'emergency_stopped',
+                             'protective_stopped', 'program_running')
+    
     def __init__(self, config: Union[str, Dict[str, Any], None] = None):
         """
         Initialize jog controller.
@@ -142,6 +146,8 @@ class JogController:
             'jog_type': self.current_type.value,
             'jogging_active': False
         }
+        self._safety_display_inputs = None  # fields the current display was rendered from
+        self._render_safety_display()
         
         self.logger.info("JogController initialized successfully")
     
@@ -483,6 +489,7 @@ class JogController:
         """
         self.emergency_stop_active = True
         self.robot_status['emergency_stopped'] = True
+        self._render_safety_display()
         
         try:
             # Stop via primary interface
@@ -585,6 +592,7 @@ class JogController:
     def _on_safety_update(self, safety_data: Dict[str, Any]):
         """Handle safety updates from WebSocket receiver."""
         self.robot_status.update(safety_data)
+        self._render_safety_display()
         
         for callback in self.safety_callbacks:
             try:
@@ -592,6 +600,39 @@ class JogController:
             except Exception as e:
                 self.logger.error(f"Error in safety callback: {e}")
     
+    def _render_safety_display(self):
+        """
+        Pre-format the safety display strings from the current status.
+        
+        Runs on whichever thread changed the safety fields, so the GUI thread
+        only has to set text. The receiver reports safety with every packet,
+        so the strings are only rebuilt when one of their input fields changed.
+        A new dict is stored each time and never mutated, which makes it safe
+        to hand across threads.
+        """
+        status = self.robot_status
+        inputs = tuple(status.get(field) for field in self.SAFETY_DISPLAY_INPUTS)
+        if inputs == self._safety_display_inputs:
+            return
+        self._safety_display_inputs = inputs
+        
+        protective_stopped = status.get('protective_stopped', False)
+        if status.get('emergency_stopped', False):
+            status_text, status_state = "Emergency Stop Active", "alarm"
+        elif protective_stopped:
+            status_text, status_state = "Protective Stop", "warning"
+        else:
+            status_text, status_state = "System Normal", "normal"
+        
+        status['safety_display'] = {
+            'robot_mode': str(status.get('robot_mode', 'Unknown')),
+            'safety_mode': str(status.get('safety_mode', 'Unknown')),
+            'protective_stop': "Yes" if protective_stopped else "No",
+            'remote_control': "Yes" if status.get('program_running', False) else "No",
+            'status_text': status_text,
+            'status_state': status_state,
+        }
+    
     def _on_data_update(self, robot_data: Dict[str, Any]):
         """Handle complete data updates from WebSocket receiver."""
         # Update speeds
@@ -655,13 +696,17 @@ class JogController:
         """Get complete robot status."""
         return self.robot_status.copy()
     
+    def get_safety_display(self) -> Dict[str, str]:
+        """Get the pre-formatted safety display strings."""
+        return self.robot_status['safety_display']
+    
     def get_tcp_pose(self) -> List[float]:
         """Get current TCP pose."""
-        return self.robot_status['tcp_pose'].copy()
+        return list(self.robot_status['tcp_pose'])
     
     def get_joint_angles(self) -> List[float]:
         """Get current joint angles."""
-        return self.robot_status['joint_angles'].copy()
+        return list(self.robot_status['joint_angles'])
     
     def is_jogging_active(self) -> bool:
         """Check if jogging is currently active."""
@@ -0,0 +1,28 @@
+"""
+Display platform environment for the Qt launchers.
+
+Must be applied before PyQt6 is imported, since Qt reads these variables
+when it selects its platform plugin.
+
+Author: jsecco ®
+"""
+
+import os
+
+
+def configure_wayland():
+    """Run Qt on the local Wayland session."""
+    os.environ.update({
+        'WAYLAND_DISPLAY': 'wayland-0',
+        'XDG_SESSION_TYPE': 'wayland',
+        'XDG_RUNTIME_DIR': '/run/user/1000',
+    })
+    os.environ.pop('DISPLAY', None)
+
+
+def configure_xcb():
+    """Run Qt through X11 on the local display (Elo i3)."""
+    os.environ.update({
+        'DISPLAY': ':0',
+        'QT_QPA_PLATFORM': 'xcb',
+    })
@@ -6,16 +6,18 @@ Author: jsecco ®
 """
 
 import sys
+import time
 import logging
+import threading
+from string import Template
 from typing import Optional, Dict, Any
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QSlider, QTabWidget, QFrame, QGroupBox,
-    QProgressBar, QTextEdit, QScrollArea, QApplication, QMessageBox
+    QProgressBar, QPlainTextEdit, QScrollArea, QApplication, QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
-from datetime import datetime
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QTextCharFormat, QTextCursor
 
 # Import jog controller and UI widgets
 from control.jog_controller import JogController
@@ -29,10 +31,154 @@ class MainWindow(QMainWindow):
     Optimized for Elo i3 touchscreen with large, touch-friendly controls.
     """
     
+    # System status label: one stylesheet, with the colour picked by its 'state' property
+    SYSTEM_STATUS_STYLE = """
+        QLabel { font-size: 16px; font-weight: bold; color: #4CAF50; }
+        QLabel[state="warning"] { color: #FF9800; }
+        QLabel[state="alarm"] { color: #F44336; }
+    """
+    
+    # Connection widgets: one prebuilt stylesheet per state
+    CONNECT_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #4CAF50;
+            font-size: 16px;
+            font-weight: bold;
+            color: white;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background-color: #45a049;
+        }
+        QPushButton:pressed {
+            background-color: #3d8b40;
+        }
+    """
+    DISCONNECT_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #F44336;
+            font-size: 16px;
+            font-weight: bold;
+            color: white;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background-color: #E53935;
+        }
+        QPushButton:pressed {
+            background-color: #D32F2F;
+        }
+    """
+    IP_SET_STYLE = "font-size: 14px; color: #4CAF50; font-weight: bold;"
+    IP_UNSET_STYLE = "font-size: 14px; color: #F44336; font-weight: bold;"
+    STATUS_CONNECTED_STYLE = "font-size: 14px; color: #4CAF50; font-weight: bold;"
+    STATUS_DISCONNECTED_STYLE = "font-size: 14px; color: #F44336;"
+    
+    # Safety status rows, in the order _on_safety_display_update fills them
+    SAFETY_LABEL_KEYS = ("Robot Mode:", "Safety Mode:", "Protective Stop:", "Remote Control:")
+    SAFETY_DISPLAY_FIELDS = ("robot_mode", "safety_mode", "protective_stop", "remote_control")
+    
+    SPEED_LABEL_FORMAT = "Current Speed: %.2f m/s"
+    
+    # Polling period while disconnected; there is only the status label to refresh
+    IDLE_POLL_INTERVAL_MS = 1000
+    
+    # Window stylesheet, built once; only the configured colours are filled in
+    MAIN_STYLE = Template("""
+        QMainWindow {
+            background-color: ${background};
+        }
+        
+        QFrame {
+            background-color: white;
+            border: 1px solid #E0E0E0;
+            border-radius: 8px;
+            margin: 2px;
+        }
+        
+        QGroupBox {
+            font-weight: bold;
+            border: 2px solid #BDBDBD;
+            border-radius: 8px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }
+        
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+            background-color: white;
+        }
+        
+        QPushButton {
+            background-color: ${primary};
+            border: none;
+            color: white;
+            padding: 8px;
+            border-radius: 6px;
+            font-size: 14px;
+            font-weight: bold;
+            min-height: 35px;
+        }
+        
+        QPushButton:hover {
+            background-color: #1976D2;
+        }
+        
+        QPushButton:pressed {
+            background-color: #0D47A1;
+        }
+        
+        QPushButton:disabled {
+            background-color: #BDBDBD;
+            color: #757575;
+        }
+        
+        QPushButton:checked {
+            background-color: #1976D2;
+            border: 2px solid #0D47A1;
+        }
+        
+        QSlider::groove:horizontal {
+            border: 1px solid #BDBDBD;
+            height: 8px;
+            background: #E0E0E0;
+            margin: 2px 0;
+            border-radius: 4px;
+        }
+        
+        QSlider::handle:horizontal {
+            background: ${primary};
+            border: 1px solid #1976D2;
+            width: 20px;
+            height: 20px;
+            margin: -6px 0;
+            border-radius: 10px;
+        }
+        
+        QLabel {
+            color: #212121;
+            font-size: 12px;
+        }
+        
+        QPlainTextEdit {
+            background-color: #FAFAFA;
+            border: 1px solid #BDBDBD;
+            border-radius: 4px;
+            padding: 5px;
+            font-family: Courier;
+            font-size: 10px;
+        }
+    """)
+    
     # Signals for UI updates
-    position_updated = pyqtSignal(dict)
-    safety_status_changed = pyqtSignal(dict)
+    # object, not dict: PyQt6 would convert a dict payload to a QVariantMap and back
+    # on every emit; the emitters always pass freshly built dicts, so sharing is safe
+    position_updated = pyqtSignal(object)
+    safety_status_changed = pyqtSignal(object)
     connection_status_changed = pyqtSignal(bool, str)
+    _position_pending = pyqtSignal()  # a queued position is waiting for the render timer
     
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """
@@ -45,13 +191,32 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._apply_config_values()
+        self._config_dialog: Optional[ConfigDialog] = None  # created on first use
+        self.robot_ip_label: Optional[QLabel] = None  # set by _setup_ui
+        self.position_display: Optional[PositionDisplay] = None  # set by _setup_ui
+        self._shown_connected = False  # connection state the widgets are styled for
+        self._shown_safety_texts = (None,) * len(self.SAFETY_LABEL_KEYS)  # texts on the safety labels
+        self._shown_system_status = ("System Normal", "normal")  # (text, state) on the status label
+        self._timestamp_cache = (0, "")  # (epoch second, formatted) for log lines
         
         # Initialize jog controller
         self.jog_controller: Optional[JogController] = None
         
-        # UI update timers
+        # UI update timer (drives both position and status refresh)
         self.position_timer = QTimer()
-        self.status_timer = QTimer()
+        self._status_every = 1  # status is refreshed on every Nth position tick
+        self._update_tick = 0
+        self._last_status = None  # last status emitted, to skip unchanged ticks
+        self._callback_safety_display = None  # display last sent from the safety callback
+        
+        # Position updates are coalesced: the newest one is shown once per window.
+        # The slot is shared with the controller's thread, hence the lock.
+        self._pending_position = None
+        self._pending_lock = threading.Lock()
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._flush_position)
         
         self._setup_ui()
         self._setup_styling()
@@ -187,12 +352,12 @@ class MainWindow(QMainWindow):
         self.cartesian_button.setCheckable(True)
         self.cartesian_button.setChecked(True)
         self.cartesian_button.setFixedHeight(50)
-        self.cartesian_button.clicked.connect(lambda: self._set_jog_mode("cartesian"))
+        self.cartesian_button.clicked.connect(self._set_cartesian_mode)
         
         self.joint_button = QPushButton("Joint")
         self.joint_button.setCheckable(True)
         self.joint_button.setFixedHeight(50)
-        self.joint_button.clicked.connect(lambda: self._set_jog_mode("joint"))
+        self.joint_button.clicked.connect(self._set_joint_mode)
         
         mode_layout.addWidget(self.cartesian_button)
         mode_layout.addWidget(self.joint_button)
@@ -209,7 +374,7 @@ class MainWindow(QMainWindow):
         self.speed_slider.valueChanged.connect(self._update_speed_display)
         speed_layout.addWidget(self.speed_slider)
         
-        self.speed_label = QLabel("Current Speed: 0.10 m/s")
+        self.speed_label = QLabel(self.SPEED_LABEL_FORMAT % (self.speed_slider.value() / 100.0))
         self.speed_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         speed_layout.addWidget(self.speed_label)
         
@@ -217,12 +382,14 @@ class MainWindow(QMainWindow):
         controls_group = QGroupBox("Jog Controls")
         left_layout.addWidget(controls_group)
         controls_layout = QGridLayout(controls_group)
+        # One stylesheet for all axis labels, instead of parsing one per label
+        controls_group.setStyleSheet('QLabel[role="axis"] { font-weight: bold; font-size: 16px; }')
         
         # Create touch-friendly jog buttons
         button_size = self.config.get('ui', {}).get('touch', {}).get('button_size', 80)
         
         # Cartesian controls
-        self.jog_buttons = {}
+        self.jog_buttons = [[None, None] for _ in range(6)]  # [axis][0 = negative, 1 = positive]
         cartesian_labels = ['X-', 'X', 'X+', 'Y-', 'Y', 'Y+', 'Z-', 'Z', 'Z+', 
                            'Rx-', 'Rx', 'Rx+', 'Ry-', 'Ry', 'Ry+', 'Rz-', 'Rz', 'Rz+']
         
@@ -230,16 +397,18 @@ class MainWindow(QMainWindow):
             if label.endswith('-') or label.endswith('+'):
                 button = QPushButton(label)
                 button.setFixedSize(button_size, button_size)
-                button.pressed.connect(lambda axis=i//3, direction=-1 if label.endswith('-') else 1: 
-                                      self._start_jog(axis, direction))
+                # One shared slot for all buttons; each carries its own axis and direction
+                button.setProperty('axis', i//3)
+                button.setProperty('direction', -1 if label.endswith('-') else 1)
+                button.pressed.connect(self._on_jog_pressed)
                 button.released.connect(self._stop_jog)
-                self.jog_buttons[label] = button
+                self.jog_buttons[i//3][label.endswith('+')] = button
                 controls_layout.addWidget(button, i//3, i%3)
             else:
                 # Center labels
                 label_widget = QLabel(label)
                 label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                label_widget.setStyleSheet("font-weight: bold; font-size: 16px;")
+                label_widget.setProperty('role', 'axis')
                 controls_layout.addWidget(label_widget, i//3, i%3)
         
         left_layout.addStretch()
@@ -267,32 +436,18 @@ class MainWindow(QMainWindow):
         
         # Network configuration display
         self.robot_ip_label = QLabel("Robot IP: Not Set")
-        self.robot_ip_label.setStyleSheet("font-size: 14px; color: #F44336; font-weight: bold;")
+        self.robot_ip_label.setStyleSheet(self.IP_UNSET_STYLE)
         connection_layout.addWidget(self.robot_ip_label)
         
         self.connection_status_label = QLabel("Status: Disconnected")
-        self.connection_status_label.setStyleSheet("font-size: 14px; color: #F44336;")
+        self.connection_status_label.setStyleSheet(self.STATUS_DISCONNECTED_STYLE)
         connection_layout.addWidget(self.connection_status_label)
         
         # Connect button
         self.connect_button = QPushButton("Connect to Robot")
         self.connect_button.setFixedHeight(50)
         self.connect_button.clicked.connect(self._toggle_connection)
-        self.connect_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.connect_button.setStyleSheet(self.CONNECT_BUTTON_STYLE)
         connection_layout.addWidget(self.connect_button)
         
         # Add some spacing
@@ -311,6 +466,7 @@ class MainWindow(QMainWindow):
         emergency_group = QGroupBox("Emergency Control")
         right_layout.addWidget(emergency_group)
         emergency_layout = QVBoxLayout(emergency_group)
+        self.emergency_group = emergency_group
         
         self.emergency_button = QPushButton("EMERGENCY\nSTOP")
         self.emergency_button.setFixedHeight(100)
@@ -333,13 +489,15 @@ class MainWindow(QMainWindow):
         
         self.system_status_label = QLabel("System Normal")
         self.system_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.system_status_label.setStyleSheet("font-size: 16px; color: #4CAF50; font-weight: bold;")
+        self.system_status_label.setProperty('state', 'normal')
+        self.system_status_label.setStyleSheet(self.SYSTEM_STATUS_STYLE)
         emergency_layout.addWidget(self.system_status_label)
         
         # Safety Status
         safety_group = QGroupBox("Safety Status")
         right_layout.addWidget(safety_group)
         safety_layout = QVBoxLayout(safety_group)
+        self.safety_group = safety_group
         
         self.safety_labels = {
             "Robot Mode:": QLabel("Unknown"),
@@ -426,135 +584,70 @@ class MainWindow(QMainWindow):
         
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # Plain text with one character format per level: no HTML to parse per line
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(200)
         self.log_text.setFont(QFont("Courier", 9))
+        # Keep only the newest lines, so appends stay cheap over long sessions;
+        # the log is read-only, so an undo history is never needed
+        self.log_text.setMaximumBlockCount(500)
+        self.log_text.setUndoRedoEnabled(False)
         log_layout.addWidget(self.log_text)
         
+        self._log_formats = {}
+        for level, color in (("INFO", "black"), ("WARNING", "orange"),
+                             ("ERROR", "red"), ("SUCCESS", "green")):
+            log_format = QTextCharFormat()
+            log_format.setForeground(QColor(color))
+            self._log_formats[level] = log_format
+        
     def _setup_styling(self):
         """Set up the application styling for touch interface."""
         # Get color scheme from config
         colors = self.config.get('ui', {}).get('colors', {})
         
         # Base stylesheet
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {colors.get('background', '#FAFAFA')};
-            }}
-            
-            QFrame {{
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-                margin: 2px;
-            }}
-            
-            QGroupBox {{
-                font-weight: bold;
-                border: 2px solid #BDBDBD;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }}
-            
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                background-color: white;
-            }}
-            
-            QPushButton {{
-                background-color: {colors.get('primary', '#2196F3')};
-                border: none;
-                color: white;
-                padding: 8px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 35px;
-            }}
-            
-            QPushButton:hover {{
-                background-color: #1976D2;
-            }}
-            
-            QPushButton:pressed {{
-                background-color: #0D47A1;
-            }}
-            
-            QPushButton:disabled {{
-                background-color: #BDBDBD;
-                color: #757575;
-            }}
-            
-            QPushButton:checked {{
-                background-color: #1976D2;
-                border: 2px solid #0D47A1;
-            }}
-            
-            QSlider::groove:horizontal {{
-                border: 1px solid #BDBDBD;
-                height: 8px;
-                background: #E0E0E0;
-                margin: 2px 0;
-                border-radius: 4px;
-            }}
-            
-            QSlider::handle:horizontal {{
-                background: {colors.get('primary', '#2196F3')};
-                border: 1px solid #1976D2;
-                width: 20px;
-                height: 20px;
-                margin: -6px 0;
-                border-radius: 10px;
-            }}
-            
-            QLabel {{
-                color: #212121;
-                font-size: 12px;
-            }}
-            
-            QTextEdit {{
-                background-color: #FAFAFA;
-                border: 1px solid #BDBDBD;
-                border-radius: 4px;
-                padding: 5px;
-                font-family: Courier;
-                font-size: 10px;
-            }}
-        """)
+        self.setStyleSheet(self.MAIN_STYLE.substitute(
+            background=colors.get('background', '#FAFAFA'),
+            primary=colors.get('primary', '#2196F3'),
+        ))
         
     def _setup_timers(self):
         """Set up update timers for UI refresh."""
-        # Position update timer
+        # Position update timer; status updates ride on it at their lower rate
+        # so each tick fetches the robot status only once
         self.position_timer.timeout.connect(self._update_position)
         
-        # Status update timer  
-        self.status_timer.timeout.connect(self._update_status)
-        
-        # Start timers based on config
+        # Start timer based on config
         feedback_config = self.config.get('ui', {}).get('feedback', {})
         position_rate = feedback_config.get('position_update_rate', 10)  # Hz
         status_rate = feedback_config.get('status_update_rate', 5)  # Hz
+        self._status_every = max(1, round(position_rate / status_rate))
         
-        self.position_timer.start(1000 // position_rate)  # Convert Hz to ms
-        self.status_timer.start(1000 // status_rate)        
-        # Keep-alive timer to ensure app stays responsive when disconnected
-        self.keep_alive_timer = QTimer(self)
-        self.keep_alive_timer.timeout.connect(self._keep_alive_tick)
-        self.keep_alive_timer.start(5000)  # Every 5 seconds
+        # Polls slowly until connected; _update_connection_display switches rates
+        self._position_period_ms = 1000 // position_rate  # Convert Hz to ms
+        self.position_timer.start(self.IDLE_POLL_INTERVAL_MS)
         
     def _connect_signals(self):
         """Connect signals between UI components."""
+        # These are emitted from controller callbacks on its worker threads as
+        # well as from the GUI thread; queue them explicitly so an emitting
+        # thread never waits on the GUI thread, whichever thread it is
+        queued = Qt.ConnectionType.QueuedConnection
+        
         # Connect position updates
+        self._position_pending.connect(self._schedule_position_flush, type=queued)
         
         # Connect safety status updates
-        self.safety_status_changed.connect(self._on_safety_display_update)
+        self.safety_status_changed.connect(self._on_safety_display_update, type=queued)
         
         # Connect connection status updates
-        self.connection_status_changed.connect(self._update_connection_display)
+        self.connection_status_changed.connect(self._update_connection_display, type=queued)
+        
+    def _apply_config_values(self):
+        """Flatten the config values read outside of setup into attributes."""
+        self._robot_ip = self.config.get('robot', {}).get('ip_address', 'Not Set')
         
     def set_jog_controller(self, controller: JogController):
         """
@@ -571,10 +664,10 @@ class MainWindow(QMainWindow):
         controller.add_connection_callback(self._on_connection_update)
         
         # Update robot IP display
-        robot_ip = self.config.get('robot', {}).get('ip_address', 'Not Set')
+        robot_ip = self._robot_ip
         self.robot_ip_label.setText(f"Robot IP: {robot_ip}")
         if robot_ip != 'Not Set':
-            self.robot_ip_label.setStyleSheet("font-size: 14px; color: #4CAF50; font-weight: bold;")
+            self.robot_ip_label.setStyleSheet(self.IP_SET_STYLE)
         
         self.logger.info("Jog controller connected to main window")
         
@@ -594,10 +687,20 @@ class MainWindow(QMainWindow):
             
         self.add_log_message(f"Jog mode set to: {mode.capitalize()}", "INFO")
         
+    @pyqtSlot()
+    def _set_cartesian_mode(self):
+        """Switch to Cartesian jogging."""
+        self._set_jog_mode("cartesian")
+        
+    @pyqtSlot()
+    def _set_joint_mode(self):
+        """Switch to joint jogging."""
+        self._set_jog_mode("joint")
+        
+    @pyqtSlot(int)
     def _update_speed_display(self, value):
         """Update speed display from slider value."""
-        speed = value / 100.0  # Convert to 0.0-1.0 range
-        self.speed_label.setText(f"Current Speed: {speed:.2f} m/s")
+        self.speed_label.setText(self.SPEED_LABEL_FORMAT % (value / 100.0))  # 0.0-1.0 range
         
     def _start_jog(self, axis: int, direction: int):
         """Start jogging in specified axis and direction."""
@@ -609,6 +712,13 @@ class MainWindow(QMainWindow):
             else:
                 self.add_log_message("Failed to start jog operation", "ERROR")
         
+    @pyqtSlot()
+    def _on_jog_pressed(self):
+        """Start jogging along the axis and direction of the pressed button."""
+        button = self.sender()
+        self._start_jog(button.property('axis'), button.property('direction'))
+        
+    @pyqtSlot()
     def _stop_jog(self):
         """Stop current jogging operation."""
         if self.jog_controller:
@@ -616,6 +726,7 @@ class MainWindow(QMainWindow):
             if success:
                 self.add_log_message("Jogging stopped", "INFO")
         
+    @pyqtSlot()
     def _toggle_connection(self):
         """Toggle robot connection."""
         if self.jog_controller:
@@ -628,7 +739,7 @@ class MainWindow(QMainWindow):
                     self.add_log_message(f"Disconnect error: {e}", "ERROR")
             else:
                 # Check if robot IP is configured
-                robot_ip = self.config.get('robot', {}).get('ip_address', '')
+                robot_ip = self._robot_ip
                 if not robot_ip or robot_ip == 'Not Set':
                     self.add_log_message("Please configure robot IP address first", "ERROR")
                     self._open_config_dialog()
@@ -641,41 +752,49 @@ class MainWindow(QMainWindow):
                 else:
                     self.add_log_message("Connection failed", "ERROR")
         
+    @pyqtSlot()
     def _emergency_stop(self):
         """Execute emergency stop."""
         if self.jog_controller:
             self.jog_controller.emergency_stop()
             self.add_log_message("EMERGENCY STOP EXECUTED", "WARNING")
-            self.system_status_label.setText("Emergency Stop Active")
-            self.system_status_label.setStyleSheet("font-size: 16px; color: #F44336; font-weight: bold;")
+            self._set_system_status("Emergency Stop Active", "alarm")
         
+    @pyqtSlot()
     def _reset_safety(self):
         """Reset safety systems."""
         if self.jog_controller:
             # This would reset emergency stop if available
             self.add_log_message("Safety reset requested", "INFO")
-            self.system_status_label.setText("System Normal")
-            self.system_status_label.setStyleSheet("font-size: 16px; color: #4CAF50; font-weight: bold;")
+            self._set_system_status("System Normal", "normal")
         
+    @pyqtSlot()
     def _power_on(self):
         """Power on robot."""
         self.add_log_message("Robot power on requested", "INFO")
         
+    @pyqtSlot()
     def _power_off(self):
         """Power off robot."""
         self.add_log_message("Robot power off requested", "INFO")
         
+    @pyqtSlot()
     def _clear_logs(self):
         """Clear the log display."""
         self.log_text.clear()
         self.add_log_message("Logs cleared", "INFO")
         
+    @pyqtSlot()
     def _open_config_dialog(self):
         """Open configuration dialog."""
         try:
-            dialog = ConfigDialog(self.config, self)
-            if hasattr(dialog, 'config_saved'):
+            # Built on first use, then reused with the form refreshed from current config
+            dialog = self._config_dialog
+            if dialog is None:
+                dialog = self._config_dialog = ConfigDialog(self.config, self)
                 dialog.config_saved.connect(self._on_config_saved)
+            else:
+                dialog.load_config(self.config)
             result = dialog.exec()
             
             if result == dialog.DialogCode.Accepted:
@@ -691,63 +810,103 @@ class MainWindow(QMainWindow):
             msg.setIcon(QMessageBox.Icon.Warning)
             msg.exec()
             
+    @pyqtSlot(dict)
     def _on_config_saved(self, new_config):
         """Handle configuration save."""
         self.config = new_config
+        self._apply_config_values()
         self.add_log_message("Configuration updated - restart to apply all changes", "SUCCESS")
         
         # Update robot IP display immediately
-        robot_ip = new_config.get('robot', {}).get('ip_address', 'Not Set')
+        robot_ip = self._robot_ip
         self.robot_ip_label.setText(f"Robot IP: {robot_ip}")
         if robot_ip != 'Not Set':
-            self.robot_ip_label.setStyleSheet("font-size: 14px; color: #4CAF50; font-weight: bold;")
+            self.robot_ip_label.setStyleSheet(self.IP_SET_STYLE)
         else:
-            self.robot_ip_label.setStyleSheet("font-size: 14px; color: #F44336; font-weight: bold;")
+            self.robot_ip_label.setStyleSheet(self.IP_UNSET_STYLE)
             
         self.add_log_message(f"Robot IP updated to: {robot_ip}", "INFO")
         
     # Update Methods
     
+    @pyqtSlot()
     def _update_position(self):
-        """Update position display from controller."""
+        """Update position (every tick) and status (every Nth tick) from controller."""
+        # Nothing to show: not every platform sends a hide event on minimise
+        if self.isMinimized() or not self.isVisible():
+            return
+        
         if self.jog_controller and self.jog_controller.is_connected():
             try:
-                # Get current robot status
+                # Get current robot status once for both displays; an idle robot
+                # yields identical snapshots, which need no emit or repaint
                 status = self.jog_controller.get_robot_status()
-                if status:
-                    self.position_updated.emit(status)
+                if status and status != self._last_status:
+                    self._last_status = status
+                    self._queue_position(status)
+                    
+                # Safety runs on its own cadence, counted on every tick, so a change
+                # is shown even if the robot stops moving right after it. It is sent
+                # every time: the display slot skips text that is already shown, and
+                # re-sending corrects labels written directly, e.g. by Reset
+                self._update_tick += 1
+                if status and self._update_tick >= self._status_every:
+                    self._update_tick = 0
+                    self.safety_status_changed.emit(status['safety_display'])
             except Exception as e:
                 self.logger.error(f"Error updating position: {e}")
         else:
-            # Keep timer active even when disconnected - this prevents Qt event loop from idling
-            # Update connection status display periodically when disconnected
-            if hasattr(self, 'position_display'):
+            # Update connection status display periodically when disconnected,
+            # and forget the last status so the displays refresh on reconnect
+            self._last_status = None
+            if self.position_display is not None:
                 self.position_display.set_connection_status(False)
                 
-    def _update_status(self):
-        """Update status display from controller.""" 
-        if self.jog_controller and self.jog_controller.is_connected():
-            try:
-                # Get current robot status
-                status = self.jog_controller.get_robot_status()
-                if status:
-                    self.safety_status_changed.emit(status)
-            except Exception as e:
-                self.logger.error(f"Error updating status: {e}")
-        else:
-            # Keep timer active - update UI to show disconnected state
-            # This ensures Qt event loop remains active
-            pass  # Timer keeps running, maintaining event loop activity
-                
     def _on_position_update(self, tcp_pose, joint_angles):
-        self.logger.info(f"Main window received position update: TCP={tcp_pose[:3]}, Joints={joint_angles[:3]}")
         """Handle position update from controller."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Main window received position update: TCP=%s, Joints=%s", tcp_pose[:3], joint_angles[:3])
         position_data = {'tcp_pose': tcp_pose, 'joint_angles': joint_angles}
-        self.position_updated.emit(position_data)
+        self._queue_position(position_data)
+        
+    def _queue_position(self, position_data):
+        """
+        Queue position data for display, collapsing bursts into a single emit.
+        
+        Safe to call from the controller's thread: only the newest data is kept,
+        and the render timer is started on the GUI thread via _position_pending.
+        The check and store happen under the lock, so a flush on the GUI thread
+        cannot take the slot in between and leave new data without an emit.
+        """
+        with self._pending_lock:
+            first = self._pending_position is None
+            self._pending_position = position_data
+        if first:
+            self._position_pending.emit()
+        
+    @pyqtSlot()
+    def _schedule_position_flush(self):
+        """Start the render window unless one is already open."""
+        if not self._render_timer.isActive():
+            self._render_timer.start(30)
+        
+    @pyqtSlot()
+    def _flush_position(self):
+        """Emit the newest queued position data."""
+        with self._pending_lock:
+            position_data, self._pending_position = self._pending_position, None
+        if position_data is not None:
+            self.position_updated.emit(position_data)
         
     def _on_safety_update(self, safety_data):
         """Handle safety status update from controller."""
-        self.safety_status_changed.emit(safety_data)
+        # The controller has already formatted the update for display, and only
+        # replaces the dict when _render_safety_display produced new strings;
+        # the receiver calls this per packet, so unchanged ones are not queued
+        display = self.jog_controller.get_safety_display()
+        if display is not self._callback_safety_display:
+            self._callback_safety_display = display
+            self.safety_status_changed.emit(display)
         
     def _on_connection_update(self, connected: bool):
         """Handle connection status update from controller."""
@@ -755,99 +914,96 @@ class MainWindow(QMainWindow):
         self.connection_status_changed.emit(connected, status_msg)
         
         
-    def _on_safety_display_update(self, status_data):
-        """Update safety status display with new data."""
+    @pyqtSlot(object)
+    def _on_safety_display_update(self, display):
+        """Update safety status display from the controller's pre-formatted strings."""
         try:
-            # Update safety status labels
-            robot_mode = status_data.get('robot_mode', 'Unknown')
-            safety_mode = status_data.get('safety_mode', 'Unknown')
-            protective_stopped = status_data.get('protective_stopped', False)
-            emergency_stopped = status_data.get('emergency_stopped', False)
+            texts = tuple(display[field] for field in self.SAFETY_DISPLAY_FIELDS)
+            system_status = (display['status_text'], display['status_state'])
             
-            self.safety_labels["Robot Mode:"].setText(str(robot_mode))
-            self.safety_labels["Safety Mode:"].setText(str(safety_mode))
-            self.safety_labels["Protective Stop:"].setText("Yes" if protective_stopped else "No")
-            self.safety_labels["Remote Control:"].setText("Yes" if status_data.get('program_running', False) else "No")
+            # Most ticks repeat what is already on screen: touch nothing then
+            if texts == self._shown_safety_texts and system_status == self._shown_system_status:
+                return
             
-            # Update system status
-            if emergency_stopped:
-                self.system_status_label.setText("Emergency Stop Active")
-                self.system_status_label.setStyleSheet("font-size: 16px; color: #F44336; font-weight: bold;")
-            elif protective_stopped:
-                self.system_status_label.setText("Protective Stop")
-                self.system_status_label.setStyleSheet("font-size: 16px; color: #FF9800; font-weight: bold;")
-            else:
-                self.system_status_label.setText("System Normal")
-                self.system_status_label.setStyleSheet("font-size: 16px; color: #4CAF50; font-weight: bold;")
+            # Suspend painting of the safety groups while their labels change,
+            # so they repaint once when updates are re-enabled
+            groups = (self.emergency_group, self.safety_group)
+            for group in groups:
+                group.setUpdatesEnabled(False)
+            try:
+                for key, text, shown in zip(self.SAFETY_LABEL_KEYS, texts, self._shown_safety_texts):
+                    if text != shown:
+                        self.safety_labels[key].setText(text)
+                self._shown_safety_texts = texts
+                self._set_system_status(*system_status)
+            finally:
+                for group in groups:
+                    group.setUpdatesEnabled(True)
                 
         except Exception as e:
             self.logger.error(f"Error updating safety display: {e}")
         
+    def _set_system_status(self, text: str, state: str):
+        """Show a system status message; state is 'normal', 'warning' or 'alarm'."""
+        if (text, state) == self._shown_system_status:
+            return
+        self._shown_system_status = (text, state)
+        self.system_status_label.setText(text)
+        if self.system_status_label.property('state') != state:
+            # Re-polish so the [state=...] selectors re-match; the stylesheet is not re-parsed
+            self.system_status_label.setProperty('state', state)
+            self.system_status_label.style().unpolish(self.system_status_label)
+            self.system_status_label.style().polish(self.system_status_label)
+        
+    @pyqtSlot(bool, str)
     def _update_connection_display(self, connected: bool, message: str):
         """Update connection status display."""
+        # Restyle the status label and button only on an actual transition
+        restyle = connected != self._shown_connected
+        self._shown_connected = connected
+        
+        # Poll at the configured rate only while there is a robot to poll
+        if restyle:
+            self.position_timer.setInterval(
+                self._position_period_ms if connected else self.IDLE_POLL_INTERVAL_MS)
+        
         # Update status label with appropriate styling
         if connected:
+            self.setWindowTitle("UR10 Jog Control - Connected")
             self.connection_status_label.setText(f"Status: Connected")
-            self.connection_status_label.setStyleSheet("font-size: 14px; color: #4CAF50; font-weight: bold;")
             
             # Update connect button to show disconnect
             self.connect_button.setText("Disconnect")
-            self.connect_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #F44336;
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: white;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #E53935;
-                }
-                QPushButton:pressed {
-                    background-color: #D32F2F;
-                }
-            """)
+            if restyle:
+                self.connection_status_label.setStyleSheet(self.STATUS_CONNECTED_STYLE)
+                self.connect_button.setStyleSheet(self.DISCONNECT_BUTTON_STYLE)
             
             # Update robot IP label to show it's connected
-            if hasattr(self, 'robot_ip_label'):
-                robot_ip = self.config.get('robot', {}).get('ip_address', 'Unknown')
-                self.robot_ip_label.setText(f"Robot IP: {robot_ip}")
-                self.robot_ip_label.setStyleSheet("font-size: 14px; color: #4CAF50; font-weight: bold;")
+            if self.robot_ip_label is not None:
+                self.robot_ip_label.setText(f"Robot IP: {self._robot_ip}")
+                self.robot_ip_label.setStyleSheet(self.IP_SET_STYLE)
                 
             # Update position display connection status
-            if hasattr(self, 'position_display'):
+            if self.position_display is not None:
                 self.position_display.set_connection_status(True)
                 
         else:
+            self.setWindowTitle("UR10 Jog Control - Disconnected")
             self.connection_status_label.setText(f"Status: {message}")
-            self.connection_status_label.setStyleSheet("font-size: 14px; color: #F44336;")
             
             # Update connect button to show connect
             self.connect_button.setText("Connect to Robot")
-            self.connect_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: white;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-                QPushButton:pressed {
-                    background-color: #3d8b40;
-                }
-            """)
+            if restyle:
+                self.connection_status_label.setStyleSheet(self.STATUS_DISCONNECTED_STYLE)
+                self.connect_button.setStyleSheet(self.CONNECT_BUTTON_STYLE)
             
             # Update robot IP label 
-            if hasattr(self, 'robot_ip_label'):
-                robot_ip = self.config.get('robot', {}).get('ip_address', 'Not Set')
-                self.robot_ip_label.setText(f"Robot IP: {robot_ip}")
-                self.robot_ip_label.setStyleSheet("font-size: 14px; color: #F44336; font-weight: bold;")
+            if self.robot_ip_label is not None:
+                self.robot_ip_label.setText(f"Robot IP: {self._robot_ip}")
+                self.robot_ip_label.setStyleSheet(self.IP_UNSET_STYLE)
                 
             # Update position display connection status
-            if hasattr(self, 'position_display'):
+            if self.position_display is not None:
                 self.position_display.set_connection_status(False)
             
     def add_log_message(self, message: str, level: str = "INFO"):
@@ -858,35 +1014,41 @@ class MainWindow(QMainWindow):
             message: Log message
             level: Log level (INFO, WARNING, ERROR, SUCCESS)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color_map = {
-            "INFO": "black",
-            "WARNING": "orange", 
-            "ERROR": "red",
-            "SUCCESS": "green"
-        }
+        timestamp = self._log_timestamp()
+        log_format = self._log_formats.get(level, self._log_formats["INFO"])
         
-        color = color_map.get(level, "black")
-        formatted_message = f'<span style="color: {color};">[{timestamp}] [{level}] {message}</span>'
-        
-        self.log_text.append(formatted_message)
-        
-        # Auto-scroll to bottom
+        # Follow new lines only if the view is already at the bottom, so a
+        # user who scrolled up to read keeps their place
         scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-        
-    def _keep_alive_tick(self):
-        """Keep-alive tick to ensure application stays responsive."""
-        # This method runs every few seconds to ensure the Qt event loop stays active
-        # It's especially important when disconnected from robot
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.logger.debug(f"Keep-alive tick at {current_time}")
-        
-        # Update window title to show current status
-        if self.jog_controller and self.jog_controller.is_connected():
-            self.setWindowTitle("UR10 Jog Control - Connected")
-        else:
-            self.setWindowTitle("UR10 Jog Control - Disconnected")
+        following = scrollbar.value() == scrollbar.maximum()
+        
+        # Append as a new block at the end, in the level's colour
+        cursor = QTextCursor(self.log_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(f"[{timestamp}] [{level}] {message}", log_format)
+        
+        if following:
+            self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        
+    def _log_timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second."""
+        second = int(time.time())
+        if second != self._timestamp_cache[0]:
+            self._timestamp_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        return self._timestamp_cache[1]
+        
+    def showEvent(self, event):
+        """Resume display polling when the window becomes visible."""
+        super().showEvent(event)
+        if not self.position_timer.isActive():
+            self.position_timer.start()  # keeps the interval for the connection state
+    
+    def hideEvent(self, event):
+        """Pause display polling while the window is hidden or minimised."""
+        super().hideEvent(event)
+        self.position_timer.stop()
     
     def closeEvent(self, event):
         """Handle window close event."""
@@ -895,9 +1057,7 @@ class MainWindow(QMainWindow):
         # Stop timers safely
         try:
             self.position_timer.stop()
-            self.status_timer.stop()
-            if hasattr(self, 'keep_alive_timer'):
-                self.keep_alive_timer.stop()
+            self._render_timer.stop()
         except Exception as e:
             self.logger.error(f"Error stopping timers: {e}")
         
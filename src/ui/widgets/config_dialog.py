@@ -443,6 +443,16 @@ class ConfigDialog(QDialog):
             }
         """)
         
+    def load_config(self, config: Dict[str, Any]):
+        """
+        Reload the form from a configuration, so the dialog can be reused.
+        
+        Args:
+            config: Current configuration dictionary
+        """
+        self.config = config.copy()
+        self._load_current_config()
+        
     def _load_current_config(self):
         """Load current configuration values into the form."""
         try:
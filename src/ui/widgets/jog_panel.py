@@ -10,9 +10,9 @@ from typing import Optional, Dict, Any
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QSlider, QButtonGroup, QGroupBox,
-    QComboBox, QCheckBox, QSpinBox
+    QComboBox, QCheckBox, QSpinBox, QStackedWidget, QToolTip
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
 
 
@@ -24,6 +24,22 @@ class JogPanel(QWidget):
     # Signals
     jog_requested = pyqtSignal(str, str, float)  # axis, direction, speed
     
+    # Jog button tooltips, formatted with the direction only when one is shown
+    JOG_TOOLTIPS = {
+        "X": "Jog X-axis (left/right) in %s direction",
+        "Y": "Jog Y-axis (forward/backward) in %s direction",
+        "Z": "Jog Z-axis (up/down) in %s direction",
+        "Rx": "Jog Rotation around X in %s direction",
+        "Ry": "Jog Rotation around Y in %s direction",
+        "Rz": "Jog Rotation around Z in %s direction",
+        "J1": "Rotate Base joint in %s direction",
+        "J2": "Rotate Shoulder joint in %s direction",
+        "J3": "Rotate Elbow joint in %s direction",
+        "J4": "Rotate Wrist 1 joint in %s direction",
+        "J5": "Rotate Wrist 2 joint in %s direction",
+        "J6": "Rotate Wrist 3 joint in %s direction",
+    }
+    
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """
         Initialize the jog panel.
@@ -47,6 +63,12 @@ class JogPanel(QWidget):
         self.speed_slider = None
         self.mode_buttons = None
         
+        # Slider drags fire valueChanged per step; the label follows once they settle
+        self._speed_debounce = QTimer(self)
+        self._speed_debounce.setSingleShot(True)
+        self._speed_debounce.setInterval(30)
+        self._speed_debounce.timeout.connect(self._update_speed_label)
+        
         self._setup_ui()
         self._setup_styling()
         
@@ -134,102 +156,56 @@ class JogPanel(QWidget):
         
         jog_layout = QVBoxLayout(jog_group)
         
-        # Create button grids for both modes
-        self._create_cartesian_buttons(jog_layout)
-        self._create_joint_buttons(jog_layout)
+        # Both grids stay built; switching mode only changes the stack's page
+        self.mode_stack = QStackedWidget()
+        jog_layout.addWidget(self.mode_stack)
         
-        # Initially show cartesian buttons
-        self.joint_buttons_widget.hide()
+        # Create button grids for both modes (cartesian first, shown initially)
+        self._create_cartesian_buttons(self.mode_stack)
+        self._create_joint_buttons(self.mode_stack)
         
-    def _create_cartesian_buttons(self, layout: QVBoxLayout):
+    def _create_cartesian_buttons(self, stack: QStackedWidget):
         """Create Cartesian jog buttons (X, Y, Z, Rx, Ry, Rz)."""
-        self.cartesian_buttons_widget = QWidget()
-        layout.addWidget(self.cartesian_buttons_widget)
+        self.cartesian_buttons_widget = self._create_axis_grid(stack, ("X", "Y", "Z", "Rx", "Ry", "Rz"))
+            
+    def _create_joint_buttons(self, stack: QStackedWidget):
+        """Create Joint jog buttons (J1-J6)."""
+        self.joint_buttons_widget = self._create_axis_grid(stack, ("J1", "J2", "J3", "J4", "J5", "J6"))
         
-        grid_layout = QGridLayout(self.cartesian_buttons_widget)
+    def _create_axis_grid(self, stack: QStackedWidget, axes) -> QWidget:
+        """Create a page with one row of "-", label and "+" per axis."""
+        grid_widget = QWidget()
+        stack.addWidget(grid_widget)
+        
+        grid_layout = QGridLayout(grid_widget)
         grid_layout.setSpacing(10)
         
-        # Define button configuration
-        cartesian_axes = [
-            ("X", "X-axis (left/right)", 0, 0, 0, 2),
-            ("Y", "Y-axis (forward/backward)", 1, 0, 1, 2),
-            ("Z", "Z-axis (up/down)", 2, 0, 2, 2),
-            ("Rx", "Rotation around X", 3, 0, 3, 2),
-            ("Ry", "Rotation around Y", 4, 0, 4, 2), 
-            ("Rz", "Rotation around Z", 5, 0, 5, 2)
-        ]
-        
-        for axis, tooltip, row, col_neg, col_pos, span in cartesian_axes:
-            # Negative direction button
-            neg_button = QPushButton(f"{axis} -")
-            neg_button.setFixedSize(120, 80)
-            neg_button.setToolTip(f"Jog {tooltip} in negative direction")
-            neg_button.pressed.connect(lambda a=axis, d="negative": self._start_jog(a, d))
-            neg_button.released.connect(self._stop_jog)
-            grid_layout.addWidget(neg_button, row, 0)
-            
-            # Axis label
+        for row, axis in enumerate(axes):
+            # Axis label between its two direction buttons
             axis_label = QLabel(axis)
             axis_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             axis_label.setStyleSheet("font-weight: bold; font-size: 14px;")
             grid_layout.addWidget(axis_label, row, 1)
             
-            # Positive direction button
-            pos_button = QPushButton(f"{axis} +")
-            pos_button.setFixedSize(120, 80)
-            pos_button.setToolTip(f"Jog {tooltip} in positive direction")
-            pos_button.pressed.connect(lambda a=axis, d="positive": self._start_jog(a, d))
-            pos_button.released.connect(self._stop_jog)
-            grid_layout.addWidget(pos_button, row, 2)
-            
-            # Store buttons for styling
-            self.jog_buttons[f"{axis}_neg"] = neg_button
-            self.jog_buttons[f"{axis}_pos"] = pos_button
-            
-    def _create_joint_buttons(self, layout: QVBoxLayout):
-        """Create Joint jog buttons (J1-J6)."""
-        self.joint_buttons_widget = QWidget()
-        layout.addWidget(self.joint_buttons_widget)
-        
-        grid_layout = QGridLayout(self.joint_buttons_widget)
-        grid_layout.setSpacing(10)
-        
-        # Define joint button configuration
-        joints = [
-            ("J1", "Base joint", 0),
-            ("J2", "Shoulder joint", 1),
-            ("J3", "Elbow joint", 2),
-            ("J4", "Wrist 1 joint", 3),
-            ("J5", "Wrist 2 joint", 4),
-            ("J6", "Wrist 3 joint", 5)
-        ]
-        
-        for joint, tooltip, row in joints:
-            # Negative direction button
-            neg_button = QPushButton(f"{joint} -")
-            neg_button.setFixedSize(120, 80)
-            neg_button.setToolTip(f"Rotate {tooltip} in negative direction")
-            neg_button.pressed.connect(lambda j=joint, d="negative": self._start_jog(j, d))
-            neg_button.released.connect(self._stop_jog)
-            grid_layout.addWidget(neg_button, row, 0)
-            
-            # Joint label
-            joint_label = QLabel(joint)
-            joint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            joint_label.setStyleSheet("font-weight: bold; font-size: 14px;")
-            grid_layout.addWidget(joint_label, row, 1)
-            
-            # Positive direction button
-            pos_button = QPushButton(f"{joint} +")
-            pos_button.setFixedSize(120, 80)
-            pos_button.setToolTip(f"Rotate {joint} in positive direction")
-            pos_button.pressed.connect(lambda j=joint, d="positive": self._start_jog(j, d))
-            pos_button.released.connect(self._stop_jog)
-            grid_layout.addWidget(pos_button, row, 2)
-            
-            # Store buttons for styling
-            self.jog_buttons[f"{joint}_neg"] = neg_button
-            self.jog_buttons[f"{joint}_pos"] = pos_button
+            for col, direction, suffix, key in ((0, "negative", "-", "neg"), (2, "positive", "+", "pos")):
+                button = self._make_jog_button(axis, direction, suffix)
+                grid_layout.addWidget(button, row, col)
+                
+                # Store buttons for styling
+                self.jog_buttons[f"{axis}_{key}"] = button
+                
+        return grid_widget
+        
+    def _make_jog_button(self, axis: str, direction: str, suffix: str) -> QPushButton:
+        """Create one jog button wired to the shared press/release slots."""
+        button = QPushButton(f"{axis} {suffix}")
+        button.setFixedSize(120, 80)
+        button.setProperty("role", "jog")
+        button.setProperty("axis", axis)
+        button.setProperty("direction", direction)
+        button.pressed.connect(self._on_jog_pressed)
+        button.released.connect(self._stop_jog)
+        return button
             
     def _create_additional_controls(self, layout: QVBoxLayout):
         """Create additional control options."""
@@ -268,34 +244,44 @@ class JogPanel(QWidget):
         # Get colors from config
         colors = self.config.get('ui', {}).get('colors', {})
         
-        # Style jog buttons
-        for button in self.jog_buttons.values():
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {colors.get('primary', '#2196F3')};
-                    border: 2px solid {colors.get('primary', '#2196F3')};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 12px;
-                    border-radius: 8px;
-                }}
-                
-                QPushButton:hover {{
-                    background-color: #1976D2;
-                }}
-                
-                QPushButton:pressed {{
-                    background-color: {colors.get('secondary', '#FFC107')};
-                    border-color: {colors.get('secondary', '#FFC107')};
-                }}
-                
-                QPushButton:disabled {{
-                    background-color: #BDBDBD;
-                    border-color: #BDBDBD;
-                    color: #757575;
-                }}
-            """)
+        # One stylesheet on the panel covers every jog button
+        self.setStyleSheet(f"""
+            QPushButton[role="jog"] {{
+                background-color: {colors.get('primary', '#2196F3')};
+                border: 2px solid {colors.get('primary', '#2196F3')};
+                color: white;
+                font-weight: bold;
+                font-size: 12px;
+                border-radius: 8px;
+            }}
+            
+            QPushButton[role="jog"]:hover {{
+                background-color: #1976D2;
+            }}
+            
+            QPushButton[role="jog"]:pressed {{
+                background-color: {colors.get('secondary', '#FFC107')};
+                border-color: {colors.get('secondary', '#FFC107')};
+            }}
             
+            QPushButton[role="jog"]:disabled {{
+                background-color: #BDBDBD;
+                border-color: #BDBDBD;
+                color: #757575;
+            }}
+        """)
+            
+    def event(self, event):
+        """Show jog button tooltips, which the buttons leave to their panel."""
+        if event.type() == QEvent.Type.ToolTip:
+            button = self.childAt(event.pos())
+            axis = button.property("axis") if button is not None else None
+            if axis in self.JOG_TOOLTIPS:
+                QToolTip.showText(event.globalPos(),
+                                  self.JOG_TOOLTIPS[axis] % button.property("direction"), button)
+                return True
+        return super().event(event)
+        
     def set_jog_controller(self, controller):
         """
         Set the jog controller for this panel.
@@ -310,21 +296,24 @@ class JogPanel(QWidget):
         """Handle mode change (Cartesian/Joint)."""
         if button == self.cartesian_button:
             self.current_mode = "cartesian"
-            self.cartesian_buttons_widget.show()
-            self.joint_buttons_widget.hide()
+            self.mode_stack.setCurrentWidget(self.cartesian_buttons_widget)
             self.speed_label.setText(f"Current Speed: {self.current_speed:.2f} m/s")
         else:
             self.current_mode = "joint"
-            self.cartesian_buttons_widget.hide()
-            self.joint_buttons_widget.show()
+            self.mode_stack.setCurrentWidget(self.joint_buttons_widget)
             self.speed_label.setText(f"Current Speed: {self.current_speed:.2f} rad/s")
             
-        self.logger.info(f"Jog mode changed to: {self.current_mode}")
+        self.logger.info("Jog mode changed to: %s", self.current_mode)
         
+    @pyqtSlot(int)
     def _on_speed_changed(self, value: int):
         """Handle speed slider change."""
         self.current_speed = value / 100.0  # Convert to 0.01-0.50 range
+        self._speed_debounce.start()
         
+    @pyqtSlot()
+    def _update_speed_label(self):
+        """Show the current speed once the slider has stopped moving."""
         if self.current_mode == "cartesian":
             self.speed_label.setText(f"Current Speed: {self.current_speed:.2f} m/s")
         else:
@@ -333,7 +322,13 @@ class JogPanel(QWidget):
     def _on_step_mode_changed(self, enabled: bool):
         """Handle step mode checkbox change."""
         self.step_size_spinbox.setEnabled(enabled)
-        self.logger.info(f"Step mode {'enabled' if enabled else 'disabled'}")
+        self.logger.info("Step mode %s", "enabled" if enabled else "disabled")
+        
+    @pyqtSlot()
+    def _on_jog_pressed(self):
+        """Start jogging along the axis and direction of the pressed button."""
+        button = self.sender()
+        self._start_jog(button.property("axis"), button.property("direction"))
         
     def _start_jog(self, axis: str, direction: str):
         """
@@ -378,7 +373,8 @@ class JogPanel(QWidget):
                     mode=self.current_mode
                 )
                 
-            self.logger.info(f"Started {'step' if step_mode else 'continuous'} jog: {axis} {direction} at {speed}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Started %s jog: %s %s at %s", "step" if step_mode else "continuous", axis, direction, speed)
             
         except Exception as e:
             self.logger.error(f"Error starting jog: {e}")
@@ -6,7 +6,10 @@ Author: jsecco ®
 """
 
 import logging
-from typing import Optional, Dict, Any
+import math
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QGroupBox, QFrame
@@ -14,12 +17,63 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtGui import QFont
 
+# Unit conversions for display (the robot reports meters and radians)
+M_TO_MM = 1000.0
+RAD_TO_DEG = 180.0 / math.pi
+TCP_AXES = ('X', 'Y', 'Z', 'Rx', 'Ry', 'Rz')
+JOINT_NAMES = ('J1', 'J2', 'J3', 'J4', 'J5', 'J6')
+
+TCP_SCALES = (M_TO_MM, M_TO_MM, M_TO_MM, RAD_TO_DEG, RAD_TO_DEG, RAD_TO_DEG)
+
+# Bound formatters for the per-frame readings, one per label with its caption
+# ('%' formatting through a bound method measured faster here than both
+# f-strings and str.format)
+_TCP_FORMATTERS = tuple(f"{axis}: %.1f".__mod__ for axis in TCP_AXES)
+_JOINT_FORMATTERS = tuple(f"{joint}: %.1f°".__mod__ for joint in JOINT_NAMES)
+
+# Readings are keyed in integer tenths of a display unit, the precision they are
+# shown at, so a robot holding still (or creeping) maps to the same key and
+# reuses its already formatted texts
+_TCP_KEY_SCALES = tuple(scale * 10 for scale in TCP_SCALES)
+_JOINT_KEY_SCALE = RAD_TO_DEG * 10
+
+@lru_cache(maxsize=64)
+def _tcp_texts(key):
+    """Label texts for a TCP pose key."""
+    return tuple(format_value(tenths / 10) for format_value, tenths in zip(_TCP_FORMATTERS, key))
+
+@lru_cache(maxsize=64)
+def _joint_texts(key):
+    """Label texts for a joint angles key."""
+    return tuple(format_angle(tenths / 10) for format_angle, tenths in zip(_JOINT_FORMATTERS, key))
 
 class PositionDisplay(QWidget):
     """
     Widget for displaying current robot position and joint angles.
     """
     
+    # Value label style, part of the panel's one stylesheet; the state property
+    # greys out the disconnected placeholders
+    VALUE_STYLE = """
+        QLabel[role="value"] {
+            background-color: #F5F5F5;
+            border: 1px solid #BDBDBD;
+            border-radius: 4px;
+            padding: 5px;
+            font-family: monospace;
+            font-size: 14px;
+            min-width: 80px;
+        }
+        
+        QLabel[role="value"][state="disconnected"] {
+            color: #BDBDBD;
+        }
+    """
+    
+    # Widest reading a value label has to fit after its caption (mm up past the
+    # UR10's reach, or degrees)
+    VALUE_SIZE_SAMPLE = "-8888.8°"
+    
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """
         Initialize the position display.
@@ -35,13 +89,29 @@ class PositionDisplay(QWidget):
         # Position data
         self.tcp_position = {"X": 0.0, "Y": 0.0, "Z": 0.0, "Rx": 0.0, "Ry": 0.0, "Rz": 0.0}
         self.joint_angles = {"J1": 0.0, "J2": 0.0, "J3": 0.0, "J4": 0.0, "J5": 0.0, "J6": 0.0}
+        self._position_view = MappingProxyType({
+            "tcp_position": MappingProxyType(self.tcp_position),
+            "joint_angles": MappingProxyType(self.joint_angles)
+        })
         
         # UI components
         self.tcp_labels = {}
         self.joint_labels = {}
+        self._shown_connected = True  # labels start in the normal style
         
-        self._setup_ui()
+        # Styling comes first: value labels are sized from their polished style
         self._setup_styling()
+        self._setup_ui()
+        
+        # Value labels in data order, and the text each currently shows,
+        # so an update only touches the labels whose text changes
+        self._tcp_label_list = [self.tcp_labels[axis] for axis in TCP_AXES]
+        self._joint_label_list = [self.joint_labels[joint] for joint in JOINT_NAMES]
+        self._all_value_labels = self._tcp_label_list + self._joint_label_list
+        self._last_tcp = [None] * 6
+        self._last_joint = [None] * 6
+        self._tcp_key = None  # key of the pose on screen; see _tcp_texts
+        self._joint_key = None
         
     def _setup_ui(self):
         """Set up the position display UI."""
@@ -62,33 +132,13 @@ class PositionDisplay(QWidget):
         tcp_layout = QGridLayout(tcp_group)
         tcp_layout.setSpacing(10)
         
-        # Position labels
-        positions = [
-            ("X", "mm", 0, 0), ("Y", "mm", 0, 2), ("Z", "mm", 0, 4),
-            ("Rx", "°", 1, 0), ("Ry", "°", 1, 2), ("Rz", "°", 1, 4)
-        ]
-        
-        for axis, unit, row, col in positions:
-            # Axis label
-            axis_label = QLabel(f"{axis}:")
-            axis_label.setStyleSheet("font-weight: bold;")
-            tcp_layout.addWidget(axis_label, row, col)
-            
-            # Value label
-            value_label = QLabel("0.00")
+        # One label per axis carries both its caption and its reading
+        for i, axis in enumerate(TCP_AXES):
+            value_label = QLabel(f"{axis}: 0.00")
             value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            value_label.setStyleSheet("""
-                QLabel {
-                    background-color: #F5F5F5;
-                    border: 1px solid #BDBDBD;
-                    border-radius: 4px;
-                    padding: 5px;
-                    font-family: monospace;
-                    font-size: 14px;
-                    min-width: 80px;
-                }
-            """)
-            tcp_layout.addWidget(value_label, row, col + 1)
+            value_label.setProperty('role', 'value')
+            tcp_layout.addWidget(value_label, i // 3, i % 3)
+            self._fix_value_size(value_label, f"{axis}: {self.VALUE_SIZE_SAMPLE}")
             
             # Store reference
             self.tcp_labels[axis] = value_label
@@ -101,37 +151,30 @@ class PositionDisplay(QWidget):
         joint_layout = QGridLayout(joint_group)
         joint_layout.setSpacing(10)
         
-        # Joint labels
-        joints = [
-            ("J1", 0, 0), ("J2", 0, 2), ("J3", 0, 4),
-            ("J4", 1, 0), ("J5", 1, 2), ("J6", 1, 4)
-        ]
-        
-        for joint, row, col in joints:
-            # Joint label
-            joint_label = QLabel(f"{joint}:")
-            joint_label.setStyleSheet("font-weight: bold;")
-            joint_layout.addWidget(joint_label, row, col)
-            
-            # Angle label
-            angle_label = QLabel("0.00°")
+        # One label per joint carries both its caption and its reading
+        for i, joint in enumerate(JOINT_NAMES):
+            angle_label = QLabel(f"{joint}: 0.00°")
             angle_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            angle_label.setStyleSheet("""
-                QLabel {
-                    background-color: #F5F5F5;
-                    border: 1px solid #BDBDBD;
-                    border-radius: 4px;
-                    padding: 5px;
-                    font-family: monospace;
-                    font-size: 14px;
-                    min-width: 80px;
-                }
-            """)
-            joint_layout.addWidget(angle_label, row, col + 1)
+            angle_label.setProperty('role', 'value')
+            joint_layout.addWidget(angle_label, i // 3, i % 3)
+            self._fix_value_size(angle_label, f"{joint}: {self.VALUE_SIZE_SAMPLE}")
             
             # Store reference
             self.joint_labels[joint] = angle_label
             
+    def _fix_value_size(self, label: QLabel, sample: str):
+        """
+        Give a value label a fixed size that fits any reading.
+        
+        Qt skips the parent layout invalidation for a widget whose minimum and
+        maximum sizes match, so later setText calls only repaint the label.
+        """
+        text = label.text()
+        label.setText(sample)
+        label.ensurePolished()  # apply the panel stylesheet's font and padding first
+        label.setFixedSize(label.sizeHint())
+        label.setText(text)
+        
     def _setup_styling(self):
         """Set up widget styling."""
         colors = self.config.get('ui', {}).get('colors', {})
@@ -152,9 +195,9 @@ class PositionDisplay(QWidget):
                 background-color: white;
                 color: {colors.get('primary', '#2196F3')};
             }}
-        """)
+        """ + self.VALUE_STYLE)
         
-    @pyqtSlot(dict)
+    @pyqtSlot(object)
     def update_position(self, position_data: Dict[str, Any]):
         """
         Update the position display with new data.
@@ -168,25 +211,45 @@ class PositionDisplay(QWidget):
                 tcp_pose = position_data['tcp_pose']
                 if isinstance(tcp_pose, (list, tuple)) and len(tcp_pose) >= 6:
                     # Convert from meters to millimeters for position, radians to degrees for rotation
-                    self.tcp_labels['X'].setText(f"{tcp_pose[0] * 1000:.1f}")
-                    self.tcp_labels['Y'].setText(f"{tcp_pose[1] * 1000:.1f}")
-                    self.tcp_labels['Z'].setText(f"{tcp_pose[2] * 1000:.1f}")
-                    self.tcp_labels['Rx'].setText(f"{tcp_pose[3] * 180 / 3.14159:.1f}")
-                    self.tcp_labels['Ry'].setText(f"{tcp_pose[4] * 180 / 3.14159:.1f}")
-                    self.tcp_labels['Rz'].setText(f"{tcp_pose[5] * 180 / 3.14159:.1f}")
+                    if all(map(math.isfinite, tcp_pose[:6])):
+                        key = tuple([round(value * scale) for value, scale in zip(tcp_pose, _TCP_KEY_SCALES)])
+                        if key != self._tcp_key:
+                            self._tcp_key = key
+                            self._show_texts(_tcp_texts(key), self._tcp_label_list, self._last_tcp)
+                    else:
+                        # NaN/inf from a malformed packet have no integer key: show them as is
+                        self._tcp_key = None
+                        texts = [format_value(value * scale) for format_value, value, scale
+                                 in zip(_TCP_FORMATTERS, tcp_pose, TCP_SCALES)]
+                        self._show_texts(texts, self._tcp_label_list, self._last_tcp)
                     
             # Update joint angles
             if 'joint_angles' in position_data:
                 joint_angles = position_data['joint_angles']
                 if isinstance(joint_angles, (list, tuple)) and len(joint_angles) >= 6:
                     # Convert from radians to degrees
-                    for i, joint in enumerate(['J1', 'J2', 'J3', 'J4', 'J5', 'J6']):
-                        if i < len(joint_angles):
-                            self.joint_labels[joint].setText(f"{joint_angles[i] * 180 / 3.14159:.1f}°")
+                    if all(map(math.isfinite, joint_angles[:6])):
+                        key = tuple([round(angle * _JOINT_KEY_SCALE) for angle in joint_angles[:6]])
+                        if key != self._joint_key:
+                            self._joint_key = key
+                            self._show_texts(_joint_texts(key), self._joint_label_list, self._last_joint)
+                    else:
+                        self._joint_key = None
+                        texts = [format_angle(angle * RAD_TO_DEG) for format_angle, angle
+                                 in zip(_JOINT_FORMATTERS, joint_angles)]
+                        self._show_texts(texts, self._joint_label_list, self._last_joint)
                             
         except Exception as e:
-            self.logger.error(f"Error updating position display: {e}")
+            self.logger.error("Error updating position display: %s", e)
             
+    @staticmethod
+    def _show_texts(texts, labels, last):
+        """Set the labels whose text differs from the one they show (kept in last)."""
+        for i, text in enumerate(texts):
+            if text != last[i]:
+                labels[i].setText(text)
+                last[i] = text
+                
     def set_connection_status(self, connected: bool):
         """
         Update display based on connection status.
@@ -194,31 +257,36 @@ class PositionDisplay(QWidget):
         Args:
             connected: True if connected to robot
         """
+        # Only a change of state needs new placeholders or styles
+        if connected == self._shown_connected:
+            return
+        self._shown_connected = connected
+        
+        # Re-polish so the [state=...] selector re-matches; the stylesheet is not re-parsed
+        state = 'connected' if connected else 'disconnected'
+        for label in self._all_value_labels:
+            label.setProperty('state', state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+            
         if not connected:
             # Show disconnected state
-            for label in self.tcp_labels.values():
-                label.setText("---")
-                label.setStyleSheet(label.styleSheet() + "color: #BDBDBD;")
-                
-            for label in self.joint_labels.values():
-                label.setText("---°")
-                label.setStyleSheet(label.styleSheet() + "color: #BDBDBD;")
-        else:
-            # Restore normal styling
-            for label in self.tcp_labels.values():
-                label.setStyleSheet(label.styleSheet().replace("color: #BDBDBD;", ""))
+            for axis, label in zip(TCP_AXES, self._tcp_label_list):
+                label.setText(f"{axis}: ---")
+            for joint, label in zip(JOINT_NAMES, self._joint_label_list):
+                label.setText(f"{joint}: ---°")
                 
-            for label in self.joint_labels.values():
-                label.setStyleSheet(label.styleSheet().replace("color: #BDBDBD;", ""))
+            # The placeholders replaced whatever values were shown
+            self._last_tcp = [None] * 6
+            self._last_joint = [None] * 6
+            self._tcp_key = self._joint_key = None
                 
-    def get_current_position(self) -> Dict[str, Any]:
+    def get_current_position(self) -> Mapping[str, Any]:
         """
         Get current displayed position data.
         
         Returns:
-            Dictionary containing current position and joint angle data
+            Read-only live view of the position and joint angle data
+            (use dict() on it for a snapshot)
         """
-        return {
-            "tcp_position": self.tcp_position.copy(),
-            "joint_angles": self.joint_angles.copy()
-        }
+        return self._position_view
@@ -6,7 +6,8 @@ Author: jsecco ®
 """
 
 import logging
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QGroupBox, QFrame
@@ -20,6 +21,67 @@ class SafetyPanel(QWidget):
     Safety control panel with emergency stop and status indicators.
     """
     
+    # Status updates arriving faster than this are shown once per window
+    REFRESH_INTERVAL_MS = 30
+    
+    EMERGENCY_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #F44336;
+            border: 4px solid #D32F2F;
+            color: white;
+            font-size: 18px;
+            font-weight: bold;
+            border-radius: 12px;
+        }
+        
+        QPushButton:hover {
+            background-color: #E53935;
+        }
+        
+        QPushButton:pressed {
+            background-color: #C62828;
+        }
+    """
+    
+    # Label styles, parsed only when a state actually changes
+    EMERGENCY_NORMAL_STYLE = """
+        QLabel {
+            background-color: #E8F5E8;
+            border: 2px solid #4CAF50;
+            border-radius: 6px;
+            padding: 5px;
+            font-weight: bold;
+            color: #2E7D32;
+        }
+    """
+    EMERGENCY_ACTIVE_STYLE = """
+        QLabel {
+            background-color: #FFEBEE;
+            border: 2px solid #F44336;
+            border-radius: 6px;
+            padding: 5px;
+            font-weight: bold;
+            color: #C62828;
+        }
+    """
+    # Status values carry both looks; the alert one is picked by [state="alert"]
+    STATUS_VALUE_STYLE = """
+        QLabel {
+            background-color: #F5F5F5;
+            border: 1px solid #BDBDBD;
+            border-radius: 4px;
+            padding: 3px 8px;
+            min-width: 100px;
+        }
+        
+        QLabel[state="alert"] {
+            background-color: #FFEBEE;
+            border: 1px solid #F44336;
+            color: #C62828;
+            font-weight: bold;
+        }
+    """
+    
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """
         Initialize the safety panel.
@@ -41,10 +103,21 @@ class SafetyPanel(QWidget):
             "protective_stopped": False,
             "in_remote_control": False
         }
+        self._safety_view = MappingProxyType(self.safety_status)
         
         # UI components
         self.emergency_button = None
         self.status_labels = {}
+        self._shown_texts: Dict[str, str] = {}  # text on each status value label
+        self._shown_emergency = False  # emergency state the status label is styled for
+        self._shown_protective = False  # protective stop state its value label is styled for
+        
+        # Status updates are coalesced: keys received within one window are
+        # merged and displayed together when the window closes
+        self._pending_safety: Dict[str, Any] = {}
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._flush_safety_status)
         
         self._setup_ui()
         self._setup_styling()
@@ -73,40 +146,14 @@ class SafetyPanel(QWidget):
         # Large emergency stop button
         self.emergency_button = QPushButton("EMERGENCY\nSTOP")
         self.emergency_button.setFixedHeight(120)
-        self.emergency_button.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                border: 4px solid #D32F2F;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 12px;
-            }
-            
-            QPushButton:hover {
-                background-color: #E53935;
-            }
-            
-            QPushButton:pressed {
-                background-color: #C62828;
-            }
-        """)
+        self.emergency_button.setStyleSheet(self.EMERGENCY_BUTTON_STYLE)
         self.emergency_button.clicked.connect(self._emergency_stop)
         emergency_layout.addWidget(self.emergency_button)
         
         # Emergency stop status
         self.emergency_status_label = QLabel("System Normal")
         self.emergency_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.emergency_status_label.setStyleSheet("""
-            QLabel {
-                background-color: #E8F5E8;
-                border: 2px solid #4CAF50;
-                border-radius: 6px;
-                padding: 5px;
-                font-weight: bold;
-                color: #2E7D32;
-            }
-        """)
+        self.emergency_status_label.setStyleSheet(self.EMERGENCY_NORMAL_STYLE)
         emergency_layout.addWidget(self.emergency_status_label)
         
     def _create_status_display(self, layout: QVBoxLayout):
@@ -136,19 +183,12 @@ class SafetyPanel(QWidget):
             # Status value
             value_label = QLabel(default_value)
             value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            value_label.setStyleSheet("""
-                QLabel {
-                    background-color: #F5F5F5;
-                    border: 1px solid #BDBDBD;
-                    border-radius: 4px;
-                    padding: 3px 8px;
-                    min-width: 100px;
-                }
-            """)
+            value_label.setStyleSheet(self.STATUS_VALUE_STYLE)
             status_row.addWidget(value_label)
             
             # Store reference
             self.status_labels[key] = value_label
+            self._shown_texts[key] = default_value
             
     def _create_control_buttons(self, layout: QVBoxLayout):
         """Create safety control buttons."""
@@ -157,15 +197,22 @@ class SafetyPanel(QWidget):
         
         control_layout = QVBoxLayout(control_group)
         
+        # Robot commands only make sense while connected; they share one
+        # container so a single setEnabled call gates them all
+        self._gated_controls = QWidget()
+        control_layout.addWidget(self._gated_controls)
+        gated_layout = QVBoxLayout(self._gated_controls)
+        gated_layout.setContentsMargins(0, 0, 0, 0)
+        
         # Reset button
         self.reset_button = QPushButton("Reset Safety")
         self.reset_button.setFixedHeight(70)
         self.reset_button.clicked.connect(self._reset_safety)
-        control_layout.addWidget(self.reset_button)
+        gated_layout.addWidget(self.reset_button)
         
         # Power control buttons
         power_layout = QHBoxLayout()
-        control_layout.addLayout(power_layout)
+        gated_layout.addLayout(power_layout)
         
         self.power_on_button = QPushButton("Power On")
         self.power_on_button.setFixedHeight(65)
@@ -181,7 +228,7 @@ class SafetyPanel(QWidget):
         self.brake_release_button = QPushButton("Release Brakes")
         self.brake_release_button.setFixedHeight(65)
         self.brake_release_button.clicked.connect(self._release_brakes)
-        control_layout.addWidget(self.brake_release_button)
+        gated_layout.addWidget(self.brake_release_button)
         
         # Connect/disconnect button
         self.connect_button = QPushButton("Connect")
@@ -193,9 +240,13 @@ class SafetyPanel(QWidget):
         """Set up widget styling."""
         colors = self.config.get('ui', {}).get('colors', {})
         
-        # Style control buttons
-        button_style = f"""
-            QPushButton {{
+        # One stylesheet on the panel covers every control button
+        for button in [self.reset_button, self.power_on_button, self.power_off_button, 
+                      self.brake_release_button, self.connect_button]:
+            button.setProperty("role", "control")
+            
+        self.setStyleSheet(f"""
+            QPushButton[role="control"] {{
                 background-color: {colors.get('primary', '#2196F3')};
                 border: none;
                 color: white;
@@ -204,24 +255,19 @@ class SafetyPanel(QWidget):
                 font-size: 13px;
             }}
             
-            QPushButton:hover {{
+            QPushButton[role="control"]:hover {{
                 background-color: #1976D2;
             }}
             
-            QPushButton:pressed {{
+            QPushButton[role="control"]:pressed {{
                 background-color: #0D47A1;
             }}
             
-            QPushButton:disabled {{
+            QPushButton[role="control"]:disabled {{
                 background-color: #BDBDBD;
                 color: #757575;
             }}
-        """
-        
-        for button in [self.reset_button, self.power_on_button, self.power_off_button, 
-                      self.brake_release_button, self.connect_button]:
-            if button:
-                button.setStyleSheet(button_style)
+        """)
                 
     def set_jog_controller(self, controller):
         """
@@ -241,81 +287,79 @@ class SafetyPanel(QWidget):
         Args:
             safety_data: Dictionary containing safety status information
         """
+        # The stored status is current straight away; only the repaint waits
+        self.safety_status.update(safety_data)
+        self._pending_safety.update(safety_data)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_INTERVAL_MS)
+            
+    @pyqtSlot()
+    def _flush_safety_status(self):
+        """Display the safety status merged since the last refresh."""
+        safety_data, self._pending_safety = self._pending_safety, {}
         try:
-            # Update safety status
+            # Work out what the labels should show
+            texts = {}
             if 'robot_mode' in safety_data:
-                self.status_labels['robot_mode'].setText(str(safety_data['robot_mode']))
-                
+                texts['robot_mode'] = str(safety_data['robot_mode'])
             if 'safety_mode' in safety_data:
-                self.status_labels['safety_mode'].setText(str(safety_data['safety_mode']))
-                
+                texts['safety_mode'] = str(safety_data['safety_mode'])
+            protective_stopped = self._shown_protective
             if 'protective_stopped' in safety_data:
-                status = "Yes" if safety_data['protective_stopped'] else "No"
-                self.status_labels['protective_stopped'].setText(status)
-                
-                # Update styling based on protective stop status
-                if safety_data['protective_stopped']:
-                    self.status_labels['protective_stopped'].setStyleSheet("""
-                        QLabel {
-                            background-color: #FFEBEE;
-                            border: 1px solid #F44336;
-                            border-radius: 4px;
-                            padding: 3px 8px;
-                            min-width: 100px;
-                            color: #C62828;
-                            font-weight: bold;
-                        }
-                    """)
-                else:
-                    self.status_labels['protective_stopped'].setStyleSheet("""
-                        QLabel {
-                            background-color: #F5F5F5;
-                            border: 1px solid #BDBDBD;
-                            border-radius: 4px;
-                            padding: 3px 8px;
-                            min-width: 100px;
-                        }
-                    """)
-                    
+                protective_stopped = bool(safety_data['protective_stopped'])
+                texts['protective_stopped'] = "Yes" if protective_stopped else "No"
             if 'in_remote_control' in safety_data:
-                status = "Yes" if safety_data['in_remote_control'] else "No"
-                self.status_labels['in_remote_control'].setText(status)
-                
-            if 'emergency_stopped' in safety_data:
-                self._update_emergency_status(safety_data['emergency_stopped'])
-                
-            # Update stored status
-            self.safety_status.update(safety_data)
+                texts['in_remote_control'] = "Yes" if safety_data['in_remote_control'] else "No"
+            emergency_stopped = bool(safety_data.get('emergency_stopped', self._shown_emergency))
+            
+            # Most refreshes repeat what is already on screen: touch nothing then
+            changed = [key for key, text in texts.items() if text != self._shown_texts.get(key)]
+            if (not changed and protective_stopped == self._shown_protective
+                    and emergency_stopped == self._shown_emergency):
+                return
+            
+            # Suspend painting while the labels change, so the panel repaints once
+            # when updates are re-enabled
+            self.setUpdatesEnabled(False)
+            try:
+                for key in changed:
+                    self._set_status_text(key, texts[key])
+                    
+                # Restyle only when the protective stop state toggles; re-polish so
+                # the [state=...] selector re-matches without re-parsing the stylesheet
+                if protective_stopped != self._shown_protective:
+                    self._shown_protective = protective_stopped
+                    label = self.status_labels['protective_stopped']
+                    label.setProperty('state', 'alert' if protective_stopped else 'normal')
+                    label.style().unpolish(label)
+                    label.style().polish(label)
+                    
+                self._update_emergency_status(emergency_stopped)
+            finally:
+                self.setUpdatesEnabled(True)
             
         except Exception as e:
-            self.logger.error(f"Error updating safety status: {e}")
+            self.logger.error("Error updating safety status: %s", e)
+            
+    def _set_status_text(self, key: str, text: str):
+        """Show text on a status value label unless it is already showing it."""
+        if text != self._shown_texts.get(key):
+            self._shown_texts[key] = text
+            self.status_labels[key].setText(text)
             
     def _update_emergency_status(self, emergency_stopped: bool):
         """Update emergency stop status display."""
+        emergency_stopped = bool(emergency_stopped)
+        if emergency_stopped == self._shown_emergency:
+            return
+        self._shown_emergency = emergency_stopped
+        
         if emergency_stopped:
             self.emergency_status_label.setText("EMERGENCY STOP ACTIVE")
-            self.emergency_status_label.setStyleSheet("""
-                QLabel {
-                    background-color: #FFEBEE;
-                    border: 2px solid #F44336;
-                    border-radius: 6px;
-                    padding: 5px;
-                    font-weight: bold;
-                    color: #C62828;
-                }
-            """)
+            self.emergency_status_label.setStyleSheet(self.EMERGENCY_ACTIVE_STYLE)
         else:
             self.emergency_status_label.setText("System Normal")
-            self.emergency_status_label.setStyleSheet("""
-                QLabel {
-                    background-color: #E8F5E8;
-                    border: 2px solid #4CAF50;
-                    border-radius: 6px;
-                    padding: 5px;
-                    font-weight: bold;
-                    color: #2E7D32;
-                }
-            """)
+            self.emergency_status_label.setStyleSheet(self.EMERGENCY_NORMAL_STYLE)
             
     def _emergency_stop(self):
         """Handle emergency stop button press."""
@@ -411,28 +455,24 @@ class SafetyPanel(QWidget):
         Args:
             connected: True if connected to robot
         """
+        # Enable or disable the robot control buttons together
+        self._gated_controls.setEnabled(connected)
+        
         if connected:
             self.connect_button.setText("Disconnect")
-            # Enable control buttons
-            for button in [self.power_on_button, self.power_off_button, 
-                          self.brake_release_button, self.reset_button]:
-                button.setEnabled(True)
         else:
             self.connect_button.setText("Connect")
-            # Disable control buttons
-            for button in [self.power_on_button, self.power_off_button, 
-                          self.brake_release_button, self.reset_button]:
-                button.setEnabled(False)
-                
+            
             # Reset status displays
-            for label in self.status_labels.values():
-                label.setText("Unknown")
+            for key in self.status_labels:
+                self._set_status_text(key, "Unknown")
                 
-    def get_safety_status(self) -> Dict[str, Any]:
+    def get_safety_status(self) -> Mapping[str, Any]:
         """
         Get current safety status.
         
         Returns:
-            Dictionary with current safety status
+            Read-only live view of the current safety status
+            (use dict() on it for a snapshot)
         """
-        return self.safety_status.copy()
+        return self._safety_view
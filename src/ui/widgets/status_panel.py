@@ -6,12 +6,13 @@ Author: jsecco ®
 """
 
 import logging
+from functools import partial
 from typing import Optional, Dict, Any
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QGroupBox, QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSlot, QTimer
 from PyQt6.QtGui import QFont
 
 
@@ -20,6 +21,61 @@ class StatusPanel(QWidget):
     Status panel for displaying system information and connection status.
     """
     
+    # Status arrives with the real-time stream; the panel is redrawn at most
+    # once per window (~15 Hz), showing the latest values
+    REFRESH_INTERVAL_MS = 66
+    
+    # Status keys shown by a single method each; connection indicator keys are
+    # added per instance, so a refresh only visits the keys actually received
+    FIELD_HANDLERS = {
+        "last_update": "_show_last_update",
+        "message_count": "_show_message_count",
+        "communication_health": "_show_health",
+    }
+    
+    # Health levels by how many of the 80/60 thresholds the value falls below
+    HEALTH_LEVELS = ("good", "fair", "poor")
+    
+    # Health bar chunk colour per level; the idle level uses the configured success colour
+    HEALTH_LEVEL_COLORS = {
+        "good": "#4CAF50",
+        "fair": "#FF9800",
+        "poor": "#F44336",
+    }
+    
+    # One panel stylesheet; indicators and the health bar pick their look
+    # through the [state=...] and [level=...] selectors
+    PANEL_STYLE = """
+        QLabel[role="indicator"] {{
+            color: #F44336;
+            font-size: 16px;
+            font-weight: bold;
+        }}
+        
+        QLabel[role="indicator"][state="connected"] {{
+            color: #4CAF50;
+        }}
+        
+        QProgressBar {{
+            border: 2px solid #BDBDBD;
+            border-radius: 6px;
+            text-align: center;
+            font-weight: bold;
+        }}
+        
+        QProgressBar::chunk {{
+            background-color: {idle_color};
+            border-radius: 4px;
+        }}
+        
+        {level_rules}
+    """
+    HEALTH_LEVEL_RULE = """
+        QProgressBar[level="{level}"]::chunk {{
+            background-color: {color};
+        }}
+    """
+    
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """
         Initialize the status panel.
@@ -46,9 +102,28 @@ class StatusPanel(QWidget):
         self.status_labels = {}
         self.connection_indicators = {}
         
+        # Last applied indicator states and health bar level, so that
+        # unchanged updates skip the re-polish
+        self._shown_indicators = {}
+        self._shown_health_level = "idle"
+        
+        # Status updates are coalesced: keys received within one window are
+        # merged and displayed together when the window closes
+        self._pending_status: Dict[str, Any] = {}
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._flush_status)
+        
         self._setup_ui()
         self._setup_styling()
         
+        # Status key -> display method
+        self._field_handlers = {key: partial(self._set_indicator, key)
+                                for key in self.connection_indicators}
+        self._field_handlers.update(
+            (key, getattr(self, name)) for key, name in self.FIELD_HANDLERS.items()
+        )
+        
     def _setup_ui(self):
         """Set up the status panel UI."""
         layout = QVBoxLayout(self)
@@ -86,17 +161,13 @@ class StatusPanel(QWidget):
             # Status indicator
             status_indicator = QLabel("●")
             status_indicator.setAlignment(Qt.AlignmentFlag.AlignRight)
-            status_indicator.setStyleSheet("""
-                QLabel {
-                    color: #F44336;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-            """)
+            status_indicator.setProperty("role", "indicator")
+            status_indicator.setProperty("state", "disconnected")
             conn_row.addWidget(status_indicator)
             
             # Store reference
             self.connection_indicators[key] = status_indicator
+            self._shown_indicators[key] = False
             
     def _create_system_info(self, layout: QVBoxLayout):
         """Create system information display."""
@@ -152,26 +223,44 @@ class StatusPanel(QWidget):
         self.health_bar.setMaximum(100)
         self.health_bar.setValue(0)
         self.health_bar.setTextVisible(True)
+        self.health_bar.setProperty("level", "idle")
         health_layout.addWidget(self.health_bar)
         
     def _setup_styling(self):
         """Set up widget styling."""
         colors = self.config.get('ui', {}).get('colors', {})
         
-        # Style progress bar
-        self.health_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid #BDBDBD;
-                border-radius: 6px;
-                text-align: center;
-                font-weight: bold;
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {colors.get('success', '#4CAF50')};
-                border-radius: 4px;
-            }}
-        """)
+        level_rules = "".join(
+            self.HEALTH_LEVEL_RULE.format(level=level, color=color)
+            for level, color in self.HEALTH_LEVEL_COLORS.items()
+        )
+        self.setStyleSheet(self.PANEL_STYLE.format(
+            idle_color=colors.get('success', '#4CAF50'),
+            level_rules=level_rules
+        ))
+        
+    @staticmethod
+    def _set_state_property(widget: QWidget, name: str, value: str):
+        """Set a styling property and re-polish so its selector re-matches."""
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        
+    def _set_indicator(self, key: str, connected: bool):
+        """Restyle a connection indicator only when its state changes."""
+        connected = bool(connected)
+        if self._shown_indicators.get(key) == connected:
+            return
+        self._shown_indicators[key] = connected
+        self._set_state_property(self.connection_indicators[key], "state",
+                                 "connected" if connected else "disconnected")
+        
+    def _set_health_level(self, level: str):
+        """Restyle the health bar only when its level changes."""
+        if level == self._shown_health_level:
+            return
+        self._shown_health_level = level
+        self._set_state_property(self.health_bar, "level", level)
         
     @pyqtSlot(dict)
     def update_status(self, status_data: Dict[str, Any]):
@@ -181,68 +270,45 @@ class StatusPanel(QWidget):
         Args:
             status_data: Dictionary containing status information
         """
+        self.system_status.update(status_data)
+        self._pending_status.update(status_data)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_INTERVAL_MS)
+            
+    @pyqtSlot()
+    def _flush_status(self):
+        """Display the status merged since the last refresh."""
+        status_data, self._pending_status = self._pending_status, {}
         try:
-            # Update connection status
-            for key, indicator in self.connection_indicators.items():
-                if key in status_data:
-                    connected = status_data[key]
-                    if connected:
-                        indicator.setStyleSheet("""
-                            QLabel {
-                                color: #4CAF50;
-                                font-size: 16px;
-                                font-weight: bold;
-                            }
-                        """)
-                    else:
-                        indicator.setStyleSheet("""
-                            QLabel {
-                                color: #F44336;
-                                font-size: 16px;
-                                font-weight: bold;
-                            }
-                        """)
-                        
-            # Update system information
-            if 'last_update' in status_data:
-                self.status_labels['last_update'].setText(str(status_data['last_update']))
-                
-            if 'message_count' in status_data:
-                self.status_labels['message_count'].setText(str(status_data['message_count']))
-                
-            # Update communication health
-            if 'communication_health' in status_data:
-                health_value = int(status_data['communication_health'])
-                self.health_bar.setValue(health_value)
-                
-                # Update health bar color based on value
-                if health_value >= 80:
-                    color = "#4CAF50"  # Green
-                elif health_value >= 60:
-                    color = "#FF9800"  # Orange
-                else:
-                    color = "#F44336"  # Red
-                    
-                self.health_bar.setStyleSheet(f"""
-                    QProgressBar {{
-                        border: 2px solid #BDBDBD;
-                        border-radius: 6px;
-                        text-align: center;
-                        font-weight: bold;
-                    }}
-                    
-                    QProgressBar::chunk {{
-                        background-color: {color};
-                        border-radius: 4px;
-                    }}
-                """)
-                
-            # Update stored status
-            self.system_status.update(status_data)
+            # Suspend painting while the indicators, labels and bar change, so
+            # the panel repaints once when updates are re-enabled
+            self.setUpdatesEnabled(False)
+            try:
+                for key, value in status_data.items():
+                    handler = self._field_handlers.get(key)
+                    if handler is not None:
+                        handler(value)
+            finally:
+                self.setUpdatesEnabled(True)
             
         except Exception as e:
-            self.logger.error(f"Error updating status display: {e}")
+            self.logger.error("Error updating status display: %s", e)
             
+    def _show_last_update(self, value: Any):
+        """Show the last update time."""
+        self.status_labels['last_update'].setText(str(value))
+        
+    def _show_message_count(self, value: Any):
+        """Show the message count."""
+        self.status_labels['message_count'].setText(str(value))
+        
+    def _show_health(self, value: Any):
+        """Show communication health on the bar, coloured by level."""
+        # Clamp so out-of-range values pin the bar instead of being ignored by it
+        health_value = max(0, min(100, int(value)))
+        self.health_bar.setValue(health_value)
+        self._set_health_level(self.HEALTH_LEVELS[(health_value < 80) + (health_value < 60)])
+        
     def update_connection_indicators(self, primary: bool, realtime: bool, dashboard: bool):
         """
         Update connection indicators.
@@ -252,47 +318,30 @@ class StatusPanel(QWidget):
             realtime: Real-time WebSocket connection status  
             dashboard: Dashboard client connection status
         """
-        connections = {
+        # Queued like any other status, so a pending refresh cannot overwrite
+        # these with older values
+        connected_count = sum([primary, realtime, dashboard])
+        self.update_status({
             'websocket_primary': primary,
             'websocket_realtime': realtime,
-            'dashboard_connected': dashboard
-        }
-        
-        for key, connected in connections.items():
-            indicator = self.connection_indicators.get(key)
-            if indicator:
-                if connected:
-                    indicator.setStyleSheet("""
-                        QLabel {
-                            color: #4CAF50;
-                            font-size: 16px;
-                            font-weight: bold;
-                        }
-                    """)
-                else:
-                    indicator.setStyleSheet("""
-                        QLabel {
-                            color: #F44336;
-                            font-size: 16px;
-                            font-weight: bold;
-                        }
-                    """)
-                    
-        # Update overall health based on connections
-        connected_count = sum([primary, realtime, dashboard])
-        health_percentage = int((connected_count / 3.0) * 100)
-        self.health_bar.setValue(health_percentage)
+            'dashboard_connected': dashboard,
+            # Update overall health based on connections
+            'communication_health': int((connected_count / 3.0) * 100)
+        })
         
     def increment_message_count(self):
         """Increment the message counter."""
+        # The count is kept as an int and only rendered at the next refresh.
+        # update_status may have stored a caller's value of any type; one that
+        # is not a number restarts the count, as an unparsable label used to
         try:
-            current_count = int(self.status_labels['message_count'].text())
-            new_count = current_count + 1
-            self.status_labels['message_count'].setText(str(new_count))
-            self.system_status['message_count'] = new_count
-        except ValueError:
-            self.status_labels['message_count'].setText("1")
-            self.system_status['message_count'] = 1
+            count = int(self.system_status['message_count']) + 1
+        except (TypeError, ValueError):
+            count = 1
+        self.system_status['message_count'] = count
+        self._pending_status['message_count'] = count
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.REFRESH_INTERVAL_MS)
             
     def update_last_update_time(self, timestamp: str):
         """
@@ -301,8 +350,7 @@ class StatusPanel(QWidget):
         Args:
             timestamp: Formatted timestamp string
         """
-        self.status_labels['last_update'].setText(timestamp)
-        self.system_status['last_update'] = timestamp
+        self.update_status({'last_update': timestamp})
         
     def get_system_status(self) -> Dict[str, Any]:
         """
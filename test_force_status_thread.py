@@ -71,11 +71,12 @@ def test_forced_status_thread():
         if not connected:
             print("Connection failed as expected. Manually starting status thread for testing...")
             
-            # Force start the status thread manually
+            # Force start the status thread manually. The loop exits as soon as it
+            # sees connected == False, so the fake connection must be set first
             jog_controller.should_stop.clear()
+            jog_controller.connected = True  # Fake connection status for position simulation
             jog_controller.status_thread = threading.Thread(target=jog_controller._status_loop, daemon=True)
             jog_controller.status_thread.start()
-            jog_controller.connected = True  # Fake connection status for position simulation
             
             print("Status thread manually started")
             
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test that the position display shows NaN/inf readings instead of freezing.
+
+Author: jsecco ®
+"""
+
+import os
+import sys
+import math
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# No display needed for this test
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+def test_nonfinite_position():
+    """Feed NaN and inf readings and check every row follows them."""
+    print("🧪 Testing position display with non-finite readings...")
+
+    from PyQt6.QtWidgets import QApplication
+    from ui.widgets.position_display import PositionDisplay
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = PositionDisplay({})
+    display.set_connection_status(True)
+
+    failures = []
+
+    def check(position_data, expected_tcp, expected_joints, description):
+        display.update_position(position_data)
+        tcp_texts = [label.text() for label in display._tcp_label_list]
+        joint_texts = [label.text() for label in display._joint_label_list]
+        if tcp_texts != expected_tcp or joint_texts != expected_joints:
+            failures.append(description)
+            print(f"   ❌ {description}: TCP={tcp_texts}, Joints={joint_texts}")
+        else:
+            print(f"   ✅ {description}")
+
+    nan, inf = math.nan, math.inf
+
+    # A finite reading first, so the rows hold cached values
+    check({'tcp_pose': [0.1, 0.2, 0.3, 0.0, 0.0, 0.0], 'joint_angles': [0.0] * 6},
+          ["X: 100.0", "Y: 200.0", "Z: 300.0", "Rx: 0.0", "Ry: 0.0", "Rz: 0.0"],
+          [f"J{i}: 0.0°" for i in range(1, 7)],
+          "finite reading")
+
+    # Malformed packet: the rows must follow instead of keeping the last values
+    check({'tcp_pose': [nan, inf, -inf, 0.0, 0.0, 0.0], 'joint_angles': [nan, inf, 0.0, 0.0, 0.0, -inf]},
+          ["X: nan", "Y: inf", "Z: -inf", "Rx: 0.0", "Ry: 0.0", "Rz: 0.0"],
+          ["J1: nan°", "J2: inf°", "J3: 0.0°", "J4: 0.0°", "J5: 0.0°", "J6: -inf°"],
+          "NaN/inf reading")
+
+    # Back to the first finite reading: the cache key was reset, so it is shown again
+    check({'tcp_pose': [0.1, 0.2, 0.3, 0.0, 0.0, 0.0], 'joint_angles': [0.0] * 6},
+          ["X: 100.0", "Y: 200.0", "Z: 300.0", "Rx: 0.0", "Ry: 0.0", "Rz: 0.0"],
+          [f"J{i}: 0.0°" for i in range(1, 7)],
+          "finite reading after NaN/inf")
+
+    display.deleteLater()
+    app.processEvents()
+    return not failures
+
+if __name__ == "__main__":
+    success = test_nonfinite_position()
+    print("🔚 Test passed" if success else "🔚 Test failed")
+    sys.exit(0 if success else 1)
@@ -6,8 +6,7 @@ Test script to verify position updates are working
 import sys
 import os
 import logging
-import time
-from threading import Timer
+from threading import Event, Timer
 
 # Add src to path
 sys.path.insert(0, 'src')
@@ -29,7 +28,8 @@ def test_position_updates():
         
         # Load config
         with open('config/robot_config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            # Parse with libyaml when PyYAML was built with it
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         
         # Create WebSocket receiver for testing
         robot_ip = config.get('robot', {}).get('ip_address', '192.168.1.100')
@@ -39,9 +39,11 @@ def test_position_updates():
         
         # Test callback setup
         position_updates_received = []
+        first_update = Event()
         
         def test_position_callback(tcp_pose, joint_angles):
             position_updates_received.append((tcp_pose, joint_angles))
+            first_update.set()
             print(f"📍 Position update: TCP={tcp_pose[:3]}, Joints={[f'{j*57.3:.1f}°' for j in joint_angles[:3]]}")
         
         # Add callback
@@ -52,8 +54,8 @@ def test_position_updates():
             print("✅ Connected to robot")
             print("⏱️  Waiting for position updates...")
             
-            # Wait for some updates
-            time.sleep(5)
+            # Wait for updates from the receiver thread, up to 5 seconds
+            first_update.wait(timeout=5)
             
             if position_updates_received:
                 print(f"✅ Received {len(position_updates_received)} position updates!")
@@ -5,6 +5,7 @@ Comprehensive verification that NO simulation is possible.
 Author: jsecco ®
 """
 
+import ast
 import yaml
 import sys
 from pathlib import Path
@@ -12,13 +13,18 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-def verify_configuration():
+# Parse with libyaml when PyYAML was built with it
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def load_config_file():
+    """Read and parse the robot configuration file."""
+    with open("config/robot_config.yaml", 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def verify_configuration(config):
     """Verify configuration has no simulation enabled."""
     print("🔍 Checking configuration...")
     
-    with open("config/robot_config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
-    
     issues = []
     
     # Check all simulation flags
@@ -50,21 +56,30 @@ def verify_main_code():
     """Verify main.py has no simulation options."""
     print("\n🔍 Checking main.py code...")
     
-    with open("src/main.py", 'r') as f:
-        content = f.read()
+    tree = ast.parse(Path("src/main.py").read_text())
     
     issues = []
     
-    # Check for simulation command line option
-    if "--simulate" in content:
-        issues.append("--simulate command line option still exists")
-    
-    if "args.simulate" in content:
-        issues.append("args.simulate handling still exists")
-    
-    # Check for hardcoded simulation enables
-    if "simulate_robot'] = True" in content:
-        issues.append("Hardcoded simulate_robot = True found")
+    for node in ast.walk(tree):
+        # Check for simulation command line option
+        if isinstance(node, ast.Constant) and node.value == "--simulate":
+            issues.append("--simulate command line option still exists")
+        
+        elif (isinstance(node, ast.Attribute) and node.attr == "simulate"
+              and isinstance(node.value, ast.Name) and node.value.id == "args"):
+            issues.append("args.simulate handling still exists")
+        
+        # Check for hardcoded simulation enables
+        elif (isinstance(node, ast.Assign)
+              and isinstance(node.value, ast.Constant) and node.value.value is True
+              and any(isinstance(target, ast.Subscript)
+                      and isinstance(target.slice, ast.Constant)
+                      and target.slice.value == "simulate_robot"
+                      for target in node.targets)):
+            issues.append("Hardcoded simulate_robot = True found")
+    
+    # A pattern used in several places is reported once
+    issues = list(dict.fromkeys(issues))
     
     if issues:
         print("❌ Main.py issues found:")
@@ -109,7 +124,7 @@ def main():
     print("🧪 Comprehensive NO SIMULATION verification")
     print("=" * 60)
     
-    config_ok = verify_configuration()
+    config_ok = verify_configuration(load_config_file())
     code_ok = verify_main_code()
     loading_ok = test_configuration_loading()
     